@@ -1,48 +1,189 @@
 """
 Binary Tree Implementation with Traversals
+
+The iter_* traversals are lazy generators driven by explicit stacks, so
+they stream values from trees of any depth without RecursionError.
+morris_inorder needs O(1) extra space: it threads temporary links
+through the tree and removes them again as it goes.
 """
 
+from collections import deque
+
+
 class TreeNode:
     def __init__(self, val):
         self.val = val
         self.left = None
         self.right = None
 
+
+def iter_inorder(root):
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.val
+        node = node.right
+
+
+def iter_preorder(root):
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node.val
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def iter_postorder(root):
+    stack = []
+    node, last = root, None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            yield top.val
+            last = stack.pop()
+
+
+def iter_level_order(root):
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        yield node.val
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+
+def _morris_walk(root):
+    node = root
+    while node:
+        if node.left is None:
+            value, node = node.val, node.right
+            yield value
+            continue
+        pred = node.left
+        while pred.right and pred.right is not node:
+            pred = pred.right
+        if pred.right is None:
+            pred.right = node  # Thread back to node
+            node = node.left
+        else:
+            pred.right = None  # Remove the thread
+            value, node = node.val, node.right
+            yield value
+
+
+def morris_inorder(root):
+    """
+    Inorder with O(1) extra space. The tree is restored even if the
+    consumer stops early: closing the generator finishes the walk silently.
+    """
+    walk = _morris_walk(root)
+    try:
+        for value in walk:
+            yield value
+    finally:
+        for _ in walk:  # Drain to remove any threads still in place
+            pass
+
+
 def inorder(root, result=None):
     if result is None:
         result = []
-    if root:
-        inorder(root.left, result)
-        result.append(root.val)
-        inorder(root.right, result)
+    result.extend(iter_inorder(root))
     return result
 
+
 def preorder(root, result=None):
     if result is None:
         result = []
-    if root:
-        result.append(root.val)
-        preorder(root.left, result)
-        preorder(root.right, result)
+    result.extend(iter_preorder(root))
     return result
 
+
 def postorder(root, result=None):
     if result is None:
         result = []
-    if root:
-        postorder(root.left, result)
-        postorder(root.right, result)
-        result.append(root.val)
+    result.extend(iter_postorder(root))
     return result
 
+
+def test_binary_tree():
+    root = TreeNode(1)
+    root.left = TreeNode(2)
+    root.right = TreeNode(3)
+    root.left.left = TreeNode(4)
+    root.left.right = TreeNode(5)
+    root.right.left = TreeNode(6)
+
+    assert inorder(root) == [4, 2, 5, 1, 6, 3]
+    assert preorder(root) == [1, 2, 4, 5, 3, 6]
+    assert postorder(root) == [4, 5, 2, 6, 3, 1]
+    assert list(iter_level_order(root)) == [1, 2, 3, 4, 5, 6]
+    assert list(morris_inorder(root)) == [4, 2, 5, 1, 6, 3]
+    assert inorder(root) == [4, 2, 5, 1, 6, 3]  # Morris threads were removed
+
+    # Stopping early must not leave threads behind
+    for stop in range(1, 7):
+        for value in morris_inorder(root):
+            if value == [4, 2, 5, 1, 6, 3][stop - 1]:
+                break
+        assert inorder(root) == [4, 2, 5, 1, 6, 3]
+        assert root.left.right.right is None and root.right.left.right is None
+    walk = morris_inorder(root)
+    assert next(walk) == 4
+    del walk  # Collected mid-walk
+    assert list(iter_inorder(root)) == [4, 2, 5, 1, 6, 3]
+    assert postorder(root) == [4, 5, 2, 6, 3, 1]
+
+    assert inorder(None) == [] and list(morris_inorder(None)) == []
+    assert list(iter_level_order(None)) == []
+
+    # Degenerate trees far deeper than the recursion limit
+    depth = 100_000
+    left_chain = TreeNode(0)
+    node = left_chain
+    for i in range(1, depth):
+        node.left = TreeNode(i)
+        node = node.left
+    assert next(iter_inorder(left_chain)) == depth - 1
+    assert len(postorder(left_chain)) == depth
+    assert list(morris_inorder(left_chain))[:3] == [depth - 1, depth - 2, depth - 3]
+
+    right_chain = TreeNode(0)
+    node = right_chain
+    for i in range(1, depth):
+        node.right = TreeNode(i)
+        node = node.right
+    assert preorder(right_chain)[-1] == depth - 1
+    assert list(iter_postorder(right_chain))[0] == depth - 1
+
+    print("✅ All binary tree tests passed!")
+
+
 # Test
 if __name__ == "__main__":
+    test_binary_tree()
+
     root = TreeNode(1)
     root.left = TreeNode(2)
     root.right = TreeNode(3)
     root.left.left = TreeNode(4)
     root.left.right = TreeNode(5)
-    
+
     print(f"Inorder: {inorder(root)}")
     print(f"Preorder: {preorder(root)}")
     print(f"Postorder: {postorder(root)}")
+    print(f"Level order: {list(iter_level_order(root))}")
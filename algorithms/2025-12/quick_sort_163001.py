@@ -1,20 +1,147 @@
 """
 Quick Sort Implementation
 Time: O(n log n) avg | Space: O(log n)
+
+quick_sort_inplace is an introsort: median-of-three pivot, Dutch-flag
+three-way partition (all-equal input is one pass), insertion sort for
+small ranges and a heapsort fallback once recursion gets too deep, so
+the worst case is O(n log n) and nothing is allocated per level.
 """
 
+SMALL_RANGE = 16
+
+
 def quick_sort(arr):
-    if len(arr) <= 1:
-        return arr
-    
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    
-    return quick_sort(left) + middle + quick_sort(right)
+    result = list(arr)
+    quick_sort_inplace(result)
+    return result
+
+
+def quick_sort_inplace(arr, lo=0, hi=None):
+    """Sort arr[lo..hi] (inclusive) in place."""
+    if hi is None:
+        hi = len(arr) - 1
+    if hi - lo < 1:
+        return
+    depth_limit = 2 * (hi - lo + 1).bit_length()
+    _introsort(arr, lo, hi, depth_limit)
+
+
+def _introsort(arr, lo, hi, depth_limit):
+    # Recurse into the smaller side and loop on the larger one,
+    # so the call stack stays O(log n) even before the depth limit.
+    while hi - lo >= SMALL_RANGE:
+        if depth_limit == 0:
+            _heap_sort(arr, lo, hi)
+            return
+        depth_limit -= 1
+
+        lt, gt = _partition3(arr, lo, hi)
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt - 1, depth_limit)
+            lo = gt + 1
+        else:
+            _introsort(arr, gt + 1, hi, depth_limit)
+            hi = lt - 1
+
+    _insertion_sort(arr, lo, hi)
+
+
+def _median_of_three(arr, lo, hi):
+    mid = lo + (hi - lo) // 2
+    a, b, c = arr[lo], arr[mid], arr[hi]
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _partition3(arr, lo, hi):
+    """Dutch national flag partition; returns (lt, gt) bounds of the pivot block."""
+    pivot = _median_of_three(arr, lo, hi)
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = arr[i]
+        if x < pivot:
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            arr[gt], arr[i] = x, arr[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and x < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+
+def _sift_down(arr, lo, root, size):
+    x = arr[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+    arr[lo + root] = x
+
+
+def _heap_sort(arr, lo, hi):
+    size = hi - lo + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def test_quick_sort():
+    import random
+
+    assert quick_sort([3, 6, 8, 10, 1, 2, 1]) == [1, 1, 2, 3, 6, 8, 10]
+    assert quick_sort([]) == []
+    assert quick_sort([7]) == [7]
+
+    rng = random.Random(7)
+    for n in (2, 15, 16, 17, 100, 1000):
+        data = [rng.randint(0, n // 3) for _ in range(n)]
+        assert quick_sort(data) == sorted(data)
+    assert quick_sort(list(range(2000))) == list(range(2000))
+    assert quick_sort(list(range(2000, 0, -1))) == list(range(1, 2001))
+    assert quick_sort([5] * 5000) == [5] * 5000
+
+    # In-place on a sub-range only
+    data = [9, 8, 7, 6, 5, 4, 3]
+    quick_sort_inplace(data, 2, 5)
+    assert data == [9, 8, 4, 5, 6, 7, 3]
+
+    # Heapsort fallback gives the same answer
+    data = [rng.random() for _ in range(500)]
+    expected = sorted(data)
+    _introsort(data, 0, len(data) - 1, 0)
+    assert data == expected
+
+    print("✅ All quick sort tests passed!")
+
 
 # Test
 if __name__ == "__main__":
+    test_quick_sort()
     arr = [3, 6, 8, 10, 1, 2, 1]
     print(f"Sorted: {quick_sort(arr)}")
@@ -0,0 +1,249 @@
+"""
+Interpolation, Exponential and Galloping Search
+===============================================
+
+Search strategies that exploit where keys are, not just that they are
+sorted:
+
+    - interpolation_search: guesses the position from the key value;
+      O(log log n) probes on roughly uniform numeric keys (e.g. monotonic
+      timestamps), O(n) worst case on skewed data
+    - exponential_search: doubles a bound from the front, then binary
+      searches; O(log i) where i is the answer's position
+    - galloping_search: exponential search starting from a hint, for
+      streams of increasing queries
+
+smart_search samples a handful of positions to decide whether the keys
+are uniform enough for interpolation and otherwise uses binary search.
+Everything is iterative, so no call stack grows with the input.
+
+Prerequisites: Array must be sorted
+"""
+
+from numbers import Real
+from typing import Any, Optional, Sequence
+
+from binary_search import lower_bound
+
+SAMPLE_POINTS = 16
+UNIFORMITY_TOLERANCE = 0.05  # max sample deviation, as a fraction of n
+MIN_INTERPOLATION_SIZE = 64
+
+METHOD_BINARY = "binary"
+METHOD_INTERPOLATION = "interpolation"
+METHOD_GALLOPING = "galloping"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def interpolation_search(arr: Sequence, target: Any) -> int:
+    """
+    Find target in a sorted numeric array by interpolating its position.
+
+    Args:
+        arr: Sorted sequence of numbers
+        target: Number to find
+
+    Returns:
+        Index of the first occurrence of target, -1 if not found
+    """
+    lo, hi = 0, len(arr) - 1
+
+    while lo <= hi:
+        lo_val, hi_val = arr[lo], arr[hi]
+        if target < lo_val or hi_val < target:
+            return -1
+        if lo_val == hi_val:
+            pos = lo
+        else:
+            # Floor division keeps int timestamps exact beyond 2**53
+            pos = lo + int((target - lo_val) * (hi - lo) // (hi_val - lo_val))
+
+        value = arr[pos]
+        if value == target:
+            if pos == lo or arr[pos - 1] < target:
+                return pos
+            return lower_bound(arr, target, lo, pos)
+        elif value < target:
+            lo = pos + 1
+        else:
+            hi = pos - 1
+
+    return -1
+
+
+def galloping_search(arr: Sequence, target: Any, start: int = 0) -> int:
+    """
+    Find the lower bound of target, galloping forward from start.
+
+    Checks start, start+1, start+3, start+7, ... until it overshoots,
+    then binary searches the last gap, so the cost is O(log d) where d is
+    the distance from start to the answer.
+
+    Args:
+        arr: Sorted sequence
+        target: Value to locate
+        start: Position known to be <= the answer; clamped to
+            [0, len(arr) - 1], so a stale -1 cannot wrap to the end
+
+    Returns:
+        First position >= start whose value is >= target (len(arr) if none).
+        This insertion point is also the right hint for the next, larger
+        query, whether or not target was present.
+    """
+    n = len(arr)
+    start = min(max(start, 0), max(n - 1, 0))
+    step = 1
+    while start + step <= n and arr[start + step - 1] < target:
+        start += step
+        step *= 2
+    return lower_bound(arr, target, start, min(start + step, n))
+
+
+def exponential_search(arr: Sequence, target: Any) -> int:
+    """
+    Find target by doubling a bound from the front of the array.
+
+    Returns:
+        Index of the first occurrence of target, -1 if not found
+    """
+    pos = galloping_search(arr, target)
+    if pos < len(arr) and arr[pos] == target:
+        return pos
+    return -1
+
+
+def choose_search_method(arr: Sequence) -> str:
+    """
+    Sample the array once and pick interpolation or binary search.
+
+    Interpolation is picked when the keys are numeric and every sampled
+    key lies within UNIFORMITY_TOLERANCE * n positions of where a
+    straight line from arr[0] to arr[-1] predicts it.
+    """
+    n = len(arr)
+    if n < MIN_INTERPOLATION_SIZE:
+        return METHOD_BINARY
+    first, last = arr[0], arr[-1]
+    if not (_is_number(first) and _is_number(last)) or first == last:
+        return METHOD_BINARY
+
+    span = last - first
+    for s in range(1, SAMPLE_POINTS):
+        i = s * (n - 1) // SAMPLE_POINTS
+        value = arr[i]
+        if not _is_number(value):
+            return METHOD_BINARY
+        expected = (value - first) * (n - 1) / span
+        if abs(expected - i) > UNIFORMITY_TOLERANCE * n:
+            return METHOD_BINARY
+    return METHOD_INTERPOLATION
+
+
+def smart_search(arr: Sequence, target: Any, method: Optional[str] = None,
+                 hint: Optional[int] = None) -> int:
+    """
+    Find target with the best method for this array.
+
+    Args:
+        arr: Sorted sequence
+        target: Value to find
+        method: Result of choose_search_method(arr); pass it in when
+            searching the same array many times to sample only once
+        hint: Position known to be <= the answer; enables galloping.
+            In a stream of increasing queries pass the last position
+            that was found - keep it on a miss instead of feeding -1
+            back. Out-of-range hints are clamped to [0, len(arr) - 1].
+
+    Returns:
+        Index of the first occurrence of target, -1 if not found
+    """
+    if hint is not None:
+        method = METHOD_GALLOPING
+    elif method is None:
+        method = choose_search_method(arr)
+
+    if method == METHOD_INTERPOLATION:
+        return interpolation_search(arr, target)
+
+    if method == METHOD_GALLOPING:
+        pos = galloping_search(arr, target, hint)
+    else:
+        pos = lower_bound(arr, target)
+    if pos < len(arr) and arr[pos] == target:
+        return pos
+    return -1
+
+
+def test_adaptive_search():
+    """Test cases for adaptive search."""
+    import random
+
+    class ProbeCounter(list):
+        probes = 0
+
+        def __getitem__(self, i):
+            ProbeCounter.probes += 1
+            return list.__getitem__(self, i)
+
+    rng = random.Random(1)
+
+    # Monotonic timestamps: interpolation takes only a few probes
+    base = 1_700_000_000_000_000_000  # ns, beyond float precision
+    stamps = ProbeCounter(base + i * 1000 + rng.randint(0, 999) for i in range(100_000))
+    assert choose_search_method(stamps) == METHOD_INTERPOLATION
+    for i in (0, 1, 777, 54321, 99_999):
+        ProbeCounter.probes = 0
+        assert interpolation_search(stamps, stamps[i]) == i
+        assert ProbeCounter.probes < 20
+    assert interpolation_search(stamps, base - 1) == -1
+    assert interpolation_search(stamps, stamps[10] + 1) == -1
+
+    # Duplicates and edge cases
+    dup = [1, 2, 2, 2, 3, 8, 8]
+    for fn in (interpolation_search, exponential_search, smart_search):
+        assert fn(dup, 2) == 1
+        assert fn(dup, 8) == 5
+        assert fn(dup, 5) == -1
+        assert fn([], 5) == -1
+    assert interpolation_search([4, 4, 4], 4) == 0
+
+    # Skewed keys fall back to binary search
+    skewed = [2 ** (i // 100) for i in range(2000)]
+    assert choose_search_method(skewed) == METHOD_BINARY
+    assert smart_search(skewed, 2 ** 7) == 700
+    assert choose_search_method(["a", "b"] * 40) == METHOD_BINARY
+
+    # Galloping from a hint over increasing queries
+    data = list(range(0, 1000, 5))
+    pos = 0
+    for target in (0, 3, 5, 45, 46, 500, 995):
+        found = smart_search(data, target, hint=pos)
+        assert found == (target // 5 if target % 5 == 0 else -1)
+        if found >= 0:
+            pos = found  # Keep the last valid position on a miss
+
+    # Even a -1 fed straight back must not poison later lookups
+    hint = smart_search(data, 3, hint=0)
+    assert hint == -1
+    assert smart_search(data, 500, hint=hint) == 100
+    assert smart_search(data, 995, hint=hint) == 199
+    assert galloping_search(data, 500, -7) == 100
+    assert galloping_search([], 1, -1) == 0
+    assert galloping_search(data, 10_000, 3) == len(data)
+    assert galloping_search(data, 12, 0) == 3
+
+    print("✅ All adaptive search tests passed!")
+
+
+if __name__ == "__main__":
+    test_adaptive_search()
+
+    # Example usage
+    timestamps = list(range(1_700_000_000, 1_700_000_000 + 10**6, 7))
+    method = choose_search_method(timestamps)
+    target = timestamps[123_456]
+    print(f"Method for timestamps: {method}")
+    print(f"Searching for {target}: found at index {smart_search(timestamps, target, method)}")
@@ -13,10 +13,19 @@ Space Complexity:
     - Iterative: O(1)
     - Recursive: O(log n) due to call stack
 
+Bound variants (lower_bound / upper_bound / equal_range) always return
+the leftmost / rightmost position among duplicates, and search_many
+answers a whole batch of targets in one merge-like pass over the array.
+
 Prerequisites: Array must be sorted
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def binary_search_iterative(arr: List[int], target: int) -> int:
@@ -77,6 +86,114 @@ def binary_search_recursive(arr: List[int], target: int,
         return binary_search_recursive(arr, target, left, mid - 1)
 
 
+def lower_bound(arr: Sequence, target: Any, lo: int = 0,
+                hi: Optional[int] = None) -> int:
+    """
+    Find the first position in arr[lo:hi] whose value is >= target.
+    
+    Args:
+        arr: Sorted sequence
+        target: Value to locate
+        lo: Left boundary (inclusive)
+        hi: Right boundary (exclusive), defaults to len(arr)
+        
+    Returns:
+        Insertion point that keeps arr sorted, before any duplicates
+    """
+    if hi is None:
+        hi = len(arr)
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    return lo
+
+
+def upper_bound(arr: Sequence, target: Any, lo: int = 0,
+                hi: Optional[int] = None) -> int:
+    """
+    Find the first position in arr[lo:hi] whose value is > target.
+    
+    Args:
+        arr: Sorted sequence
+        target: Value to locate
+        lo: Left boundary (inclusive)
+        hi: Right boundary (exclusive), defaults to len(arr)
+        
+    Returns:
+        Insertion point that keeps arr sorted, after any duplicates
+    """
+    if hi is None:
+        hi = len(arr)
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if target < arr[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    
+    return lo
+
+
+def equal_range(arr: Sequence, target: Any) -> Tuple[int, int]:
+    """
+    Find the half-open range of positions holding target.
+    
+    Returns:
+        (lower_bound, upper_bound); the range is empty if target is absent
+    """
+    first = lower_bound(arr, target)
+    return first, upper_bound(arr, target, first)
+
+
+def search_many(arr: Sequence, targets: Sequence) -> List[int]:
+    """
+    Find many targets in one sorted array.
+    
+    The targets are sorted once and merged against the array: each lookup
+    gallops forward from the previous answer, so a batch costs
+    O(k log k + k log(n / k)) instead of k full binary searches.
+    NumPy arrays are delegated to numpy.searchsorted.
+    
+    Args:
+        arr: Sorted sequence (list, array.array or NumPy array)
+        targets: Values to find, in any order
+        
+    Returns:
+        Index of the first occurrence of each target (in the order given),
+        -1 for targets that are not present. A NumPy array is returned
+        when arr is a NumPy array.
+    """
+    n = len(arr)
+    
+    if np is not None and isinstance(arr, np.ndarray):
+        targets = np.asarray(targets)
+        idx = np.searchsorted(arr, targets, side="left")
+        if n == 0:
+            return np.full(idx.shape, -1, dtype=np.intp)
+        found = (idx < n) & (arr[np.minimum(idx, n - 1)] == targets)
+        return np.where(found, idx, -1)
+    
+    result = [-1] * len(targets)
+    pos = 0
+    for i in sorted(range(len(targets)), key=targets.__getitem__):
+        target = targets[i]
+        # Gallop from the previous position, then binary search the window
+        step = 1
+        while pos + step < n and arr[pos + step - 1] < target:
+            step *= 2
+        pos = lower_bound(arr, target, pos, min(pos + step, n))
+        if pos < n and arr[pos] == target:
+            result[i] = pos
+    
+    return result
+
+
 def test_binary_search():
     """Test cases for binary search."""
     sorted_arr = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
@@ -94,6 +211,27 @@ def test_binary_search():
     assert binary_search_recursive(sorted_arr, 19) == 9
     assert binary_search_recursive(sorted_arr, 8) == -1
     
+    # Test bound variants with duplicates
+    dup_arr = [1, 2, 2, 2, 5, 7, 7]
+    assert lower_bound(dup_arr, 2) == 1
+    assert upper_bound(dup_arr, 2) == 4
+    assert equal_range(dup_arr, 7) == (5, 7)
+    assert equal_range(dup_arr, 3) == (4, 4)
+    assert lower_bound(dup_arr, 0) == 0
+    assert upper_bound(dup_arr, 9) == 7
+    assert lower_bound([], 1) == 0
+    
+    # Test batched search
+    assert search_many(dup_arr, [7, 2, 3, 1, 9, 2]) == [5, 1, -1, 0, -1, 1]
+    assert search_many([], [1, 2]) == [-1, -1]
+    big = list(range(0, 20000, 2))
+    targets = [17, 4, 19998, 3, 0, 10001, 5000]
+    assert search_many(big, targets) == \
+        [binary_search_iterative(big, t) for t in targets]
+    if np is not None:
+        found = search_many(np.array(dup_arr), [7, 2, 3, 9])
+        assert found.tolist() == [5, 1, -1, -1]
+    
     print("✅ All binary search tests passed!")
 
 
@@ -0,0 +1,370 @@
+"""
+Sorted List Container
+=====================
+
+A list that stays sorted as values are added and removed, so callers no
+longer need append-and-resort. Values live in bounded-size sorted
+buckets: binary search over the bucket maxima finds the bucket, binary
+search inside it finds the slot, and a Fenwick tree over the bucket
+lengths turns (bucket, offset) into a global position and back.
+
+Operations and Time Complexity (B = bucket load, n / B buckets):
+    - add / remove:     O(log n + B) - shifting inside one small bucket
+    - bisect / index:   O(log n)
+    - k-th element:     O(log n)
+    - range iteration:  O(log n + k) for k yielded values
+    - contains / count: O(log n)
+
+Space Complexity: O(n)
+"""
+
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+from binary_search import lower_bound, upper_bound
+
+DEFAULT_LOAD = 1000
+
+
+class SortedList:
+    """Sorted container with logarithmic insert, delete and positional lookup."""
+
+    def __init__(self, iterable: Optional[Iterable] = None, load: int = DEFAULT_LOAD):
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._load = load
+        self._len = 0
+        self._lists: List[list] = []
+        self._maxes: list = []
+        self._tree: List[int] = [0]
+        if iterable is not None:
+            self.update(iterable)
+
+    # ------------------------------------------------------------------
+    # Positional index (Fenwick tree over bucket lengths)
+    # ------------------------------------------------------------------
+
+    def _build_index(self) -> None:
+        """Rebuild the Fenwick tree after buckets were split or merged. O(n / B)"""
+        tree = [0] + [len(bucket) for bucket in self._lists]
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _index_add(self, bucket: int, delta: int) -> None:
+        tree = self._tree
+        i = bucket + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, bucket: int) -> int:
+        """Number of values stored before the given bucket."""
+        tree = self._tree
+        total = 0
+        i = bucket
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index: int):
+        """Map a global position to (bucket, offset) by descending the tree."""
+        tree = self._tree
+        bucket = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = bucket + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                index -= tree[nxt]
+                bucket = nxt
+            step >>= 1
+        return bucket, index
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, value: Any) -> None:
+        """Insert value, after any equal values already present."""
+        lists, maxes = self._lists, self._maxes
+
+        if not lists:
+            lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            self._build_index()
+            return
+
+        pos = upper_bound(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            bucket = lists[pos]
+            bucket.insert(upper_bound(bucket, value), value)
+        self._len += 1
+
+        if len(lists[pos]) > 2 * self._load:
+            bucket = lists[pos]
+            half = bucket[self._load:]
+            del bucket[self._load:]
+            maxes[pos] = bucket[-1]
+            lists.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+            self._build_index()
+        else:
+            self._index_add(pos, 1)
+
+    def update(self, iterable: Iterable) -> None:
+        """Add many values at once by sorting and re-bucketing. O(n log n)"""
+        values = list(iterable)
+        if not values:
+            return
+        values.extend(chain.from_iterable(self._lists))
+        values.sort()
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+        self._len = len(values)
+        self._build_index()
+
+    def _delete(self, pos: int, idx: int) -> None:
+        """Remove lists[pos][idx] and keep buckets balanced."""
+        lists, maxes = self._lists, self._maxes
+        bucket = lists[pos]
+        del bucket[idx]
+        self._len -= 1
+
+        if len(bucket) > self._load // 2:
+            maxes[pos] = bucket[-1]
+            self._index_add(pos, -1)
+        elif len(lists) > 1:
+            # Fold the small bucket into a neighbour and re-split if too big
+            if pos == 0:
+                pos = 1
+            prev = lists[pos - 1]
+            prev.extend(lists[pos])
+            del lists[pos]
+            del maxes[pos]
+            maxes[pos - 1] = prev[-1]
+            if len(prev) > 2 * self._load:
+                half = prev[self._load:]
+                del prev[self._load:]
+                maxes[pos - 1] = prev[-1]
+                lists.insert(pos, half)
+                maxes.insert(pos, half[-1])
+            self._build_index()
+        elif bucket:
+            maxes[pos] = bucket[-1]
+            self._index_add(pos, -1)
+        else:
+            del lists[pos]
+            del maxes[pos]
+            self._build_index()
+
+    def discard(self, value: Any) -> bool:
+        """Remove one occurrence of value. Returns True if it was present."""
+        pos = lower_bound(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        idx = lower_bound(bucket, value)
+        if bucket[idx] != value:
+            return False
+        self._delete(pos, idx)
+        return True
+
+    def remove(self, value: Any) -> None:
+        """Remove one occurrence of value; raises ValueError if missing."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the value at a position. O(log n)"""
+        pos, idx = self._locate(self._normalize(index))
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def clear(self) -> None:
+        self._lists, self._maxes, self._tree, self._len = [], [], [0], 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(reversed(bucket) for bucket in reversed(self._lists))
+
+    def __repr__(self) -> str:
+        return f"SortedList({list(self)})"
+
+    def __contains__(self, value: Any) -> bool:
+        pos = lower_bound(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        return bucket[lower_bound(bucket, value)] == value
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the k-th smallest value (negative indices allowed)."""
+        pos, idx = self._locate(self._normalize(index))
+        return self._lists[pos][idx]
+
+    def bisect_left(self, value: Any) -> int:
+        """Position where value would be inserted before equal values."""
+        pos = lower_bound(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + lower_bound(self._lists[pos], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """Position where value would be inserted after equal values."""
+        pos = upper_bound(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + upper_bound(self._lists[pos], value)
+
+    bisect = bisect_right
+
+    def count(self, value: Any) -> int:
+        """Number of occurrences of value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value: Any) -> int:
+        """Position of the first occurrence of value; ValueError if missing."""
+        pos = self.bisect_left(value)
+        if pos == self._len or self[pos] != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        return pos
+
+    def islice(self, start: int = 0, stop: Optional[int] = None) -> Iterator:
+        """Iterate positions start..stop-1 without copying the list."""
+        if stop is None or stop > self._len:
+            stop = self._len
+        if start >= stop:
+            return iter(())
+        pos, idx = self._locate(start)
+        values = chain(islice(self._lists[pos], idx, None),
+                       chain.from_iterable(self._lists[pos + 1:]))
+        return islice(values, stop - start)
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive=(True, True)) -> Iterator:
+        """
+        Iterate values between minimum and maximum in sorted order.
+
+        Args:
+            minimum: Lower bound, None for unbounded
+            maximum: Upper bound, None for unbounded
+            inclusive: Whether each bound is included
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+
+        return self.islice(start, stop)
+
+
+def test_sorted_list():
+    """Test cases for SortedList."""
+    import random
+
+    sl = SortedList([5, 1, 3])
+    assert list(sl) == [1, 3, 5] and len(sl) == 3
+    sl.add(4)
+    sl.add(3)
+    assert list(sl) == [1, 3, 3, 4, 5]
+    assert sl.bisect_left(3) == 1 and sl.bisect_right(3) == 3
+    assert sl.index(3) == 1 and sl.count(3) == 2
+    assert sl[0] == 1 and sl[-1] == 5
+    assert list(sl.irange(2, 4)) == [3, 3, 4]
+    assert list(sl.irange(3, 5, inclusive=(False, False))) == [4]
+    sl.remove(3)
+    assert list(sl) == [1, 3, 4, 5]
+    assert 3 in sl and 2 not in sl
+    assert not sl.discard(42)
+    try:
+        sl.index(2)
+        assert False, "missing value should raise"
+    except ValueError:
+        pass
+
+    # Randomised comparison against a plain sorted list, small load to
+    # exercise bucket splits and merges
+    rng = random.Random(9)
+    sl = SortedList(load=8)
+    ref = []
+    for _ in range(5000):
+        op = rng.random()
+        value = rng.randint(0, 300)
+        if op < 0.6:
+            sl.add(value)
+            ref.insert(upper_bound(ref, value), value)
+        elif op < 0.9:
+            assert sl.discard(value) == (value in ref)
+            if value in ref:
+                ref.remove(value)
+        elif ref:
+            k = rng.randrange(len(ref))
+            assert sl.pop(k) == ref.pop(k)
+        assert len(sl) == len(ref)
+    assert list(sl) == ref
+    assert list(reversed(sl)) == ref[::-1]
+    for k in range(len(ref)):
+        assert sl[k] == ref[k]
+    for value in range(-1, 302):
+        assert sl.bisect_left(value) == lower_bound(ref, value)
+        assert sl.bisect_right(value) == upper_bound(ref, value)
+    assert list(sl.islice(10, 20)) == ref[10:20]
+    assert list(sl.irange(50, 100)) == [v for v in ref if 50 <= v <= 100]
+
+    while sl:
+        sl.pop(0)
+    assert list(sl) == [] and list(sl.irange()) == []
+
+    print("✅ All sorted list tests passed!")
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    test_sorted_list()
+
+    # Example: keep a sorted index up to date instead of append-and-resort
+    n = 1_000_000
+    sl = SortedList()
+    start = time.perf_counter()
+    for _ in range(n):
+        sl.add(random.random())
+    elapsed = time.perf_counter() - start
+    print(f"{n:,} adds in {elapsed:.2f}s; median = {sl[n // 2]:.4f}")
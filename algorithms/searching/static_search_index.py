@@ -0,0 +1,170 @@
+"""
+Static Search Index (Eytzinger Layout)
+======================================
+
+A read-only index for sorted arrays that are built once and queried many
+times. The values are re-laid in Eytzinger (BFS) order inside a compact
+``array.array``: node k has children 2k and 2k+1, so the first levels of
+every search share the same few cache lines, and the descent
+``k = 2k + (b[k] < x)`` needs no data-dependent branch.
+
+Time Complexity:
+    - Build:  O(n)
+    - Lookup: O(log n)
+
+Space Complexity: O(n) - values plus their sorted ranks, both unboxed
+
+Prerequisites: Input must be sorted
+"""
+
+from array import array
+from typing import Any, Iterable
+
+
+class StaticSearchIndex:
+    """Sorted array stored in Eytzinger order for fast repeated lookups."""
+
+    def __init__(self, sorted_values: Iterable, typecode: str = "q"):
+        values = array(typecode, sorted_values)
+        n = len(values)
+        for i in range(1, n):
+            if values[i] < values[i - 1]:
+                raise ValueError("StaticSearchIndex requires sorted input")
+
+        self._n = n
+        # 1-indexed: slot 0 is padding so child arithmetic stays 2k / 2k+1
+        self._tree = array(typecode, bytes(values.itemsize * (n + 1)))
+        self._rank = array("q", bytes(8 * (n + 1)))
+
+        # In-order walk of the implicit tree assigns values in sorted order
+        stack = []
+        k, i = 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._tree[k] = values[i]
+            self._rank[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, target: Any) -> bool:
+        return self.contains(target)
+
+    def _lower_bound_slot(self, target: Any) -> int:
+        """Eytzinger slot of the first value >= target, 0 if there is none."""
+        tree = self._tree
+        n = self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < target)
+        # Undo the trailing right turns plus the final left turn
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, target: Any) -> int:
+        """
+        Find the first sorted position whose value is >= target.
+
+        Returns:
+            Index into the original sorted array, len(self) if none
+        """
+        k = self._lower_bound_slot(target)
+        return self._rank[k] if k else self._n
+
+    def find(self, target: Any) -> int:
+        """
+        Find target in the index.
+
+        Returns:
+            Index of the first occurrence in the original sorted array,
+            -1 if not found
+        """
+        k = self._lower_bound_slot(target)
+        if k and self._tree[k] == target:
+            return self._rank[k]
+        return -1
+
+    def contains(self, target: Any) -> bool:
+        """Check whether target is in the index."""
+        k = self._lower_bound_slot(target)
+        return bool(k) and self._tree[k] == target
+
+
+def benchmark(sizes=(10**6,), queries: int = 200_000) -> None:
+    """Compare lookups/sec against binary_search_iterative and bisect."""
+    import random
+    import time
+    from bisect import bisect_left
+
+    from binary_search import binary_search_iterative
+
+    rng = random.Random(0)
+    for n in sizes:
+        data = array("q", range(0, 2 * n, 2))
+        index = StaticSearchIndex(data)
+        targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+        def run_bisect():
+            for t in targets:
+                i = bisect_left(data, t)
+                if i == n or data[i] != t:
+                    i = -1
+
+        candidates = (
+            ("binary_search_iterative", lambda: [binary_search_iterative(data, t) for t in targets]),
+            ("bisect", run_bisect),
+            ("StaticSearchIndex.find", lambda: [index.find(t) for t in targets]),
+        )
+        print(f"n={n:,}, {queries:,} random lookups")
+        for name, fn in candidates:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"  {name:>24}: {queries / elapsed:>12,.0f} lookups/sec")
+
+
+def test_static_search_index():
+    """Test cases for the static search index."""
+    from bisect import bisect_left
+
+    data = [1, 3, 3, 3, 5, 8, 13, 21, 34]
+    index = StaticSearchIndex(data)
+    assert len(index) == 9
+    for t in range(-1, 40):
+        assert index.lower_bound(t) == bisect_left(data, t)
+        expected = bisect_left(data, t) if t in data else -1
+        assert index.find(t) == expected
+        assert (t in index) == (t in data)
+
+    # Every size from empty to a few full levels
+    for n in range(0, 70):
+        values = list(range(0, 3 * n, 3))
+        index = StaticSearchIndex(values)
+        assert [index.find(v) for v in values] == list(range(n))
+        assert index.find(1) == -1
+        assert index.lower_bound(3 * n) == n
+
+    floats = StaticSearchIndex([0.5, 1.5, 2.5], typecode="d")
+    assert floats.find(1.5) == 1 and not floats.contains(2.0)
+
+    try:
+        StaticSearchIndex([3, 1, 2])
+        assert False, "unsorted input should be rejected"
+    except ValueError:
+        pass
+
+    print("✅ All static search index tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_static_search_index()
+
+    # Benchmark: python static_search_index.py 1000000 10000000 ...
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (10**6,)
+    benchmark(sizes)
@@ -0,0 +1,276 @@
+"""
+Hybrid Sort Engine
+==================
+
+An adaptive sorting engine that keeps the ``bubble_sort(arr)`` contract
+(returns a new sorted list, never touches the input) but picks a strategy
+at runtime based on the shape of the data:
+
+    - "insertion": binary insertion sort for tiny inputs
+    - "run_merge": natural-run detection + galloping merges for partly
+                   sorted input (already sorted / reversed input is O(n))
+    - "merge_sort": bottom-up merge sort over insertion-sorted blocks
+
+Time Complexity:
+    - Best:    O(n)       - already sorted or reversed input
+    - Average: O(n log n)
+    - Worst:   O(n log n)
+
+Space Complexity: O(n) - one copy of the input plus merge buffers
+
+Stable: Yes (also with ``key=`` and ``reverse=True``)
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, List, Optional, Tuple
+
+INSERTION_THRESHOLD = 64  # inputs this small are insertion sorted
+MIN_RUN = 32              # natural runs shorter than this on average -> merge sort
+
+STRATEGY_INSERTION = "insertion"
+STRATEGY_RUN_MERGE = "run_merge"
+STRATEGY_MERGE_SORT = "merge_sort"
+
+
+def _binary_insertion_sort(a: list, lo: int, hi: int, start: Optional[int] = None) -> None:
+    """Sort a[lo:hi] in place; a[lo:start] is assumed sorted already."""
+    if start is None:
+        start = lo + 1
+    for i in range(start, hi):
+        x = a[i]
+        pos = bisect_right(a, x, lo, i)
+        if pos != i:
+            a[pos + 1:i + 1] = a[pos:i]
+            a[pos] = x
+
+
+def _find_runs(a: list) -> List[int]:
+    """
+    Split a into maximal natural runs and return their boundaries.
+
+    Strictly descending runs are reversed in place (strictness keeps the
+    sort stable). The returned list is [0, end_1, end_2, ..., len(a)].
+    """
+    n = len(a)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and a[hi] < a[lo]:
+            while hi < n and a[hi] < a[hi - 1]:
+                hi += 1
+            a[lo:hi] = a[lo:hi][::-1]
+        else:
+            while hi < n and not a[hi] < a[hi - 1]:
+                hi += 1
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+
+def _merge(a: list, lo: int, mid: int, hi: int, gallop: bool) -> None:
+    """
+    Merge sorted a[lo:mid] and a[mid:hi] in place.
+
+    With ``gallop`` enabled, elements already in their final position are
+    trimmed off with a binary search first, and whole blocks are copied at
+    once instead of one element per comparison.
+    """
+    if gallop:
+        # Left-run prefix <= a[mid] and right-run suffix >= a[mid - 1] are in place
+        lo = bisect_right(a, a[mid], lo, mid)
+        if lo == mid:
+            return
+        hi = bisect_left(a, a[mid - 1], mid, hi)
+
+    left = a[lo:mid]
+    n_left = len(left)
+    i, j, k = 0, mid, lo
+
+    if gallop:
+        while i < n_left and j < hi:
+            if a[j] < left[i]:
+                end = bisect_left(a, left[i], j, hi)
+                a[k:k + end - j] = a[j:end]
+                k += end - j
+                j = end
+            else:
+                end = bisect_right(left, a[j], i, n_left)
+                a[k:k + end - i] = left[i:end]
+                k += end - i
+                i = end
+    else:
+        while i < n_left and j < hi:
+            if a[j] < left[i]:
+                a[k] = a[j]
+                j += 1
+            else:
+                a[k] = left[i]
+                i += 1
+            k += 1
+
+    if i < n_left:
+        a[k:k + n_left - i] = left[i:]
+
+
+def _merge_bounds(a: list, bounds: List[int], gallop: bool) -> None:
+    """Repeatedly merge neighbouring runs until one run is left."""
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 2, 2):
+            if r + 2 < len(bounds):
+                _merge(a, bounds[r], bounds[r + 1], bounds[r + 2], gallop)
+                merged.append(bounds[r + 2])
+        if merged[-1] != bounds[-1]:
+            merged.append(bounds[-1])
+        bounds = merged
+
+
+def _sort_in_place(a: list) -> str:
+    """Sort list a in place and return the name of the strategy used."""
+    n = len(a)
+    if n <= INSERTION_THRESHOLD:
+        _binary_insertion_sort(a, 0, n)
+        return STRATEGY_INSERTION
+
+    bounds = _find_runs(a)
+    runs = len(bounds) - 1
+    if n // runs >= MIN_RUN:
+        _merge_bounds(a, bounds, gallop=True)
+        return STRATEGY_RUN_MERGE
+
+    # Mostly random data: insertion-sort fixed blocks, then plain merges.
+    # Reversed descending runs from _find_runs are harmless here.
+    bounds = list(range(0, n, MIN_RUN)) + [n]
+    for lo, hi in zip(bounds, bounds[1:]):
+        _binary_insertion_sort(a, lo, hi)
+    _merge_bounds(a, bounds, gallop=False)
+    return STRATEGY_MERGE_SORT
+
+
+def hybrid_sort_with_strategy(arr: List[Any],
+                              key: Optional[Callable[[Any], Any]] = None,
+                              reverse: bool = False) -> Tuple[List[Any], str]:
+    """
+    Sort an array and report which strategy the engine picked.
+
+    Args:
+        arr: List of comparable items (only ``<`` is used)
+        key: Optional function extracting a comparison key from each item
+        reverse: Sort in descending order, keeping equal items stable
+
+    Returns:
+        Tuple of (sorted list, strategy name)
+    """
+    if key is None:
+        result = list(arr)
+        if reverse:
+            result.reverse()
+        strategy = _sort_in_place(result)
+    else:
+        # Decorate once so key() runs n times; the index keeps it stable
+        # and stops ties from ever comparing the items themselves.
+        items = list(arr)
+        if reverse:
+            items.reverse()
+        decorated = [(key(item), i) for i, item in enumerate(items)]
+        strategy = _sort_in_place(decorated)
+        result = [items[i] for _, i in decorated]
+
+    if reverse:
+        result.reverse()
+    return result, strategy
+
+
+def hybrid_sort(arr: List[Any],
+                key: Optional[Callable[[Any], Any]] = None,
+                reverse: bool = False) -> List[Any]:
+    """
+    Sort an array using the adaptive hybrid engine.
+
+    Drop-in replacement for ``bubble_sort(arr)``: returns a new list in
+    ascending order and leaves the original untouched.
+
+    Args:
+        arr: List of comparable items
+        key: Optional function extracting a comparison key from each item
+        reverse: Sort in descending order
+
+    Returns:
+        Sorted list
+    """
+    return hybrid_sort_with_strategy(arr, key=key, reverse=reverse)[0]
+
+
+def test_hybrid_sort():
+    """Test cases for hybrid sort."""
+    import random
+
+    # Same contract as bubble_sort
+    assert hybrid_sort([64, 34, 25, 12, 22, 11, 90]) == [11, 12, 22, 25, 34, 64, 90]
+    assert hybrid_sort([]) == []
+    assert hybrid_sort([42]) == [42]
+    assert hybrid_sort([3, 1, 4, 1, 5, 9, 2, 6]) == [1, 1, 2, 3, 4, 5, 6, 9]
+    original = [3, 2, 1]
+    hybrid_sort(original)
+    assert original == [3, 2, 1]
+
+    # Strategy selection
+    rng = random.Random(42)
+    assert hybrid_sort_with_strategy([5, 4, 3])[1] == STRATEGY_INSERTION
+    assert hybrid_sort_with_strategy(list(range(1000)))[1] == STRATEGY_RUN_MERGE
+    assert hybrid_sort_with_strategy(list(range(1000, 0, -1)))[1] == STRATEGY_RUN_MERGE
+    data = [rng.randint(0, 1000) for _ in range(1000)]
+    result, strategy = hybrid_sort_with_strategy(data)
+    assert strategy == STRATEGY_MERGE_SORT
+    assert result == sorted(data)
+
+    # Partly sorted: a few long runs
+    data = sorted(rng.random() for _ in range(500)) + sorted(rng.random() for _ in range(500))
+    result, strategy = hybrid_sort_with_strategy(data)
+    assert strategy == STRATEGY_RUN_MERGE
+    assert result == sorted(data)
+
+    # key= and reverse= match sorted(), including stability
+    pairs = [(rng.randint(0, 9), i) for i in range(2000)]
+    for rev in (False, True):
+        assert hybrid_sort(pairs, key=lambda p: p[0], reverse=rev) == \
+            sorted(pairs, key=lambda p: p[0], reverse=rev)
+        assert hybrid_sort(pairs[:20], key=lambda p: p[0], reverse=rev) == \
+            sorted(pairs[:20], key=lambda p: p[0], reverse=rev)
+    assert hybrid_sort([1, 3, 2], reverse=True) == [3, 2, 1]
+
+    for n in (0, 1, 2, 63, 64, 65, 100, 1025):
+        data = [rng.randint(-50, 50) for _ in range(n)]
+        assert hybrid_sort(data) == sorted(data)
+
+    print("✅ All hybrid sort tests passed!")
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from bubble_sort import bubble_sort
+
+    test_hybrid_sort()
+
+    # Example: compare against bubble_sort on a few input shapes
+    n = 3000
+    shapes = {
+        "random": [random.randint(0, n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "two runs": list(range(0, n, 2)) + list(range(1, n, 2)),
+    }
+    for name, data in shapes.items():
+        start = time.perf_counter()
+        bubble_sort(data)
+        bubble_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _, strategy = hybrid_sort_with_strategy(data)
+        hybrid_time = time.perf_counter() - start
+
+        print(f"{name:>9}: bubble {bubble_time:.4f}s | hybrid {hybrid_time:.4f}s "
+              f"({strategy}, {bubble_time / hybrid_time:.0f}x)")
@@ -0,0 +1,285 @@
+"""
+Parallel Sort Implementation
+============================
+
+Multi-core sample sort in two rounds on a ProcessPoolExecutor:
+
+    1. The input is split into one contiguous partition per worker. Each
+       worker sorts its partition and cuts it at p - 1 splitters, chosen
+       from a random sample so the value ranges are about equal in size.
+    2. Worker j gathers the j-th piece of every sorted partition and sorts
+       those (already sorted) runs into the j-th value range of the output.
+
+Output ranges are disjoint and already in final order, so the parent only
+concatenates them. No serial k-way merge caps the speedup.
+
+Numeric data (``array.array`` or lists of plain ints/floats) is copied
+once into ``multiprocessing.shared_memory``; workers read and write
+shared buffers, so only names, bounds and splitters are pickled.
+Anything else falls back to pickling the partitions.
+
+Inputs smaller than ``threshold`` are sorted in the current process,
+where the pool start-up cost would outweigh any gain.
+
+Time Complexity:
+    - O((n/p) log n) per worker in each round, O(n) to assemble the output
+
+Space Complexity: O(n) - two shared buffers (or pickled pieces) plus output
+
+Stable: Yes - pieces are gathered in input order and Timsort is stable
+"""
+
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_THRESHOLD = 100_000
+OVERSAMPLE = 32
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+# Typecodes memoryview.cast accepts; others ('u', 'w') use the pickled path
+SHARED_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+def _shared_typecode(data: Sequence) -> Optional[str]:
+    """Return an array typecode if data can travel through shared memory."""
+    if isinstance(data, array):
+        return data.typecode if data.typecode in SHARED_TYPECODES else None
+    if not isinstance(data, list) or not data:
+        return None
+    first = type(data[0])
+    if first is int:
+        if all(type(x) is int for x in data) and \
+                INT64_MIN <= min(data) and max(data) <= INT64_MAX:
+            return "q"
+    elif first is float:
+        if all(type(x) is float for x in data):
+            return "d"
+    return None
+
+
+def _bounds(n: int, parts: int) -> List[int]:
+    """Split range(n) into `parts` near-equal contiguous partitions."""
+    return [n * i // parts for i in range(parts + 1)]
+
+
+def _splitters(data: Sequence, parts: int) -> List[Any]:
+    """parts - 1 values cutting a random sample of data into equal ranges."""
+    rng = random.Random(len(data))
+    sample = sorted(data[rng.randrange(len(data))] for _ in range(parts * OVERSAMPLE))
+    return [sample[i * len(sample) // parts] for i in range(1, parts)]
+
+
+def _buckets(cuts: List[List[int]]) -> List[List[Tuple[int, int]]]:
+    """Transpose per-partition cut points into per-bucket (lo, hi) pieces."""
+    return [[(c[j], c[j + 1]) for c in cuts] for j in range(len(cuts[0]) - 1)]
+
+
+def _sort_shared_slice(name: str, typecode: str, lo: int, hi: int,
+                       splitters: List[Any]) -> List[int]:
+    """Worker: sort view[lo:hi] in place; return its cut points."""
+    shm = SharedMemory(name=name)
+    view = shm.buf.cast(typecode)
+    try:
+        view[lo:hi] = array(typecode, sorted(view[lo:hi]))
+        return [lo] + [bisect_right(view, s, lo, hi) for s in splitters] + [hi]
+    finally:
+        view.release()
+        shm.close()
+
+
+def _merge_shared_bucket(src_name: str, dst_name: str, typecode: str,
+                         pieces: List[Tuple[int, int]], out: int) -> None:
+    """Worker: sort the sorted pieces of one bucket into dst[out:]."""
+    src, dst = SharedMemory(name=src_name), SharedMemory(name=dst_name)
+    src_view, dst_view = src.buf.cast(typecode), dst.buf.cast(typecode)
+    try:
+        bucket = array(typecode)
+        size = bucket.itemsize
+        for lo, hi in pieces:
+            bucket.frombytes(src.buf[lo * size:hi * size])
+        dst_view[out:out + len(bucket)] = array(typecode, sorted(bucket))
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+def _parallel_sort_shared(data: Sequence, typecode: str, workers: int):
+    n = len(data)
+    src = data if isinstance(data, array) else array(typecode, data)
+    splitters = _splitters(src, workers)
+    shms: List[SharedMemory] = []
+    views: List[memoryview] = []
+    try:
+        for _ in range(2):
+            shms.append(SharedMemory(create=True, size=n * src.itemsize))
+            views.append(shms[-1].buf.cast(typecode))
+        view, out_view = views
+        view[:n] = src
+        bounds = _bounds(n, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            cuts = list(pool.map(_sort_shared_slice, *zip(*(
+                (shms[0].name, typecode, lo, hi, splitters)
+                for lo, hi in zip(bounds, bounds[1:])))))
+            buckets = _buckets(cuts)
+            offsets = [0]
+            for pieces in buckets:
+                offsets.append(offsets[-1] + sum(hi - lo for lo, hi in pieces))
+            for future in [pool.submit(_merge_shared_bucket, shms[0].name, shms[1].name,
+                                       typecode, pieces, out)
+                           for pieces, out in zip(buckets, offsets)]:
+                future.result()
+
+        if isinstance(data, array):
+            result = array(typecode)
+            result.frombytes(shms[1].buf[:n * src.itemsize])
+            return result
+        return out_view.tolist()
+    finally:
+        # Views export the buffers: release them first, or close() raises
+        # BufferError and hides the original exception
+        for view in views:
+            view.release()
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
+def _sort_and_cut(chunk: list, splitters: List[Any]) -> List[list]:
+    """Worker: sort a pickled partition and cut it at the splitters."""
+    chunk.sort()
+    cuts = [0] + [bisect_right(chunk, s) for s in splitters] + [len(chunk)]
+    return [chunk[lo:hi] for lo, hi in zip(cuts, cuts[1:])]
+
+
+def _sort_bucket(pieces: List[list]) -> list:
+    """Worker: sort the sorted pieces of one bucket."""
+    return sorted(chain.from_iterable(pieces))
+
+
+def _parallel_sort_pickled(data: Sequence, workers: int) -> list:
+    splitters = _splitters(data, workers)
+    bounds = _bounds(len(data), workers)
+    chunks = [list(data[lo:hi]) for lo, hi in zip(bounds, bounds[1:])]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pieces = list(pool.map(_sort_and_cut, chunks, [splitters] * workers))
+        runs = pool.map(_sort_bucket, [[p[j] for p in pieces] for j in range(workers)])
+        result: list = []
+        for run in runs:
+            result.extend(run)
+    return result
+
+
+def parallel_sort(data: Sequence, workers: Optional[int] = None,
+                  threshold: int = DEFAULT_THRESHOLD) -> Union[list, array]:
+    """
+    Sort data using several processes.
+
+    Args:
+        data: List of comparable items, or an array.array
+        workers: Number of processes (defaults to os.cpu_count())
+        threshold: Inputs shorter than this are sorted in-process
+
+    Returns:
+        New sorted list (or array.array of the same typecode if data is one)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    n = len(data)
+    if workers == 1 or n < threshold or n < 2 * workers:
+        if isinstance(data, array):
+            return array(data.typecode, sorted(data))
+        return sorted(data)
+
+    typecode = _shared_typecode(data)
+    if typecode is not None:
+        return _parallel_sort_shared(data, typecode, workers)
+    result = _parallel_sort_pickled(data, workers)
+    return array(data.typecode, result) if isinstance(data, array) else result
+
+
+def test_parallel_sort():
+    """Test cases for parallel sort."""
+    import random
+
+    rng = random.Random(11)
+
+    # In-process fallback
+    assert parallel_sort([3, 1, 2]) == [1, 2, 3]
+    assert parallel_sort([]) == []
+
+    # Shared-memory path: ints, floats and array.array
+    ints = [rng.randint(-10**15, 10**15) for _ in range(5000)]
+    assert parallel_sort(ints, workers=3, threshold=0) == sorted(ints)
+    floats = [rng.random() for _ in range(5000)]
+    assert parallel_sort(floats, workers=2, threshold=0) == sorted(floats)
+    arr = array("q", ints)
+    result = parallel_sort(arr, workers=4, threshold=0)
+    assert isinstance(result, array) and list(result) == sorted(ints)
+    assert _shared_typecode(ints) == "q"
+    assert _shared_typecode([1, 2**70]) is None
+
+    # Heavy duplicates and already-sorted input still land in order
+    dups = [rng.randrange(3) for _ in range(6000)]
+    assert parallel_sort(dups, workers=4, threshold=0) == sorted(dups)
+    ordered = list(range(6000))
+    assert parallel_sort(ordered, workers=3, threshold=0) == ordered
+
+    # Stability: -0.0 == 0.0 but the input order must be kept
+    zeros = [0.0 if i % 2 else -0.0 for i in range(4000)] + [1.0, -1.0]
+    out = parallel_sort(zeros, workers=3, threshold=0)
+    assert [str(x) for x in out] == [str(x) for x in sorted(zeros)]
+
+    # A failure with shared buffers still exported surfaces as itself,
+    # not as BufferError from close(), and the segments are unlinked
+    try:
+        _parallel_sort_shared(array("q", range(100)), "d", 2)
+        assert False, "mismatched typecode should fail"
+    except ValueError:
+        pass
+
+    # Pickled path: mixed / non-numeric items
+    words = [str(rng.random()) for _ in range(3000)]
+    assert _shared_typecode(words) is None
+    assert parallel_sort(words, workers=3, threshold=0) == sorted(words)
+    # Arrays memoryview cannot cast (unicode) are pickled but keep their type
+    chars = array("u", "".join(rng.choice("parallel sort") for _ in range(3000)))
+    assert _shared_typecode(chars) is None
+    result = parallel_sort(chars, workers=3, threshold=0)
+    assert isinstance(result, array) and result.typecode == "u"
+    assert result.tolist() == sorted(chars)
+
+    print("✅ All parallel sort tests passed!")
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    test_parallel_sort()
+
+    # Example: speedup over sorted() on a large integer array
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    data = array("q", (random.getrandbits(63) for _ in range(n)))
+
+    start = time.perf_counter()
+    sorted(data)
+    base = time.perf_counter() - start
+    print(f"n={n:,} single process: {base:.2f}s")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        parallel_sort(data, workers=workers, threshold=0)
+        elapsed = time.perf_counter() - start
+        print(f"  workers={workers:>2}: {elapsed:.2f}s ({base / elapsed:.2f}x)")
@@ -0,0 +1,320 @@
+"""
+CSR (Compressed Sparse Row) Graph Implementation
+================================================
+
+A static graph over integer node IDs 0..n-1 stored as two flat columns:
+
+    offsets  n + 1 entries ('q'); the out-edges of u are
+             targets[offsets[u]:offsets[u + 1]]
+    targets  m entries ('i', or 'q' for n >= 2**31)
+    weights  optional m entries ('d'), parallel to targets
+
+That is 4-8 bytes per edge instead of a Python int object inside a list
+inside a dict, and neighbours of a node sit next to each other in memory.
+
+BFS marks nodes in a bytearray bitmap when they are *enqueued*, so every
+node enters the queue at most once and every edge is examined exactly
+once. The queue is a preallocated array of n slots and DFS keeps an
+array-backed stack of (node, next edge) pairs, so traversal memory is
+O(n) regardless of the edge count.
+
+Operations and Time Complexity:
+    - Build from edges:      O(n + m) (counting sort by source)
+    - neighbors / degree:    O(1) to locate, O(degree) to read
+    - BFS / DFS:             O(n + m), each edge examined once
+    - transpose:             O(n + m)
+
+Space Complexity: O(n + m) for the graph, O(n) per traversal
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+def _node_typecode(num_nodes: int) -> str:
+    return "i" if num_nodes < 2 ** 31 else "q"
+
+
+class CSRGraph:
+    """Immutable directed graph in compressed sparse row form."""
+
+    __slots__ = ("num_nodes", "offsets", "targets", "weights")
+
+    def __init__(self, num_nodes: int, offsets: array, targets: array,
+                 weights: Optional[array] = None):
+        if len(offsets) != num_nodes + 1 or offsets[-1] != len(targets):
+            raise ValueError("offsets must have num_nodes + 1 entries ending at len(targets)")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must be parallel to targets")
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_arrays(cls, sources: Sequence[int], targets: Sequence[int],
+                    num_nodes: Optional[int] = None,
+                    weights: Optional[Sequence[float]] = None) -> "CSRGraph":
+        """
+        Build from parallel source / target (/ weight) columns.
+
+        Edges keep their input order within each source node.
+
+        Args:
+            sources: Source node of each edge
+            targets: Target node of each edge
+            num_nodes: Node count, default max node ID + 1
+            weights: Optional edge weights
+        """
+        m = len(sources)
+        if len(targets) != m or (weights is not None and len(weights) != m):
+            raise ValueError("edge columns must have the same length")
+        if num_nodes is None:
+            num_nodes = max(max(sources, default=-1), max(targets, default=-1)) + 1
+        if m and (min(sources) < 0 or min(targets) < 0
+                  or max(sources) >= num_nodes or max(targets) >= num_nodes):
+            raise ValueError("node IDs must be in range(num_nodes)")
+
+        # Counting sort by source: degree histogram -> prefix sums -> scatter
+        offsets = array("q", bytes(8 * (num_nodes + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+
+        code = _node_typecode(num_nodes)
+        out = array(code, bytes(array(code).itemsize * m))
+        out_weights = array("d", bytes(8 * m)) if weights is not None else None
+        cursor = offsets[:-1]
+        for i in range(m):
+            u = sources[i]
+            pos = cursor[u]
+            out[pos] = targets[i]
+            if out_weights is not None:
+                out_weights[pos] = weights[i]
+            cursor[u] = pos + 1
+        return cls(num_nodes, offsets, out, out_weights)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple], num_nodes: Optional[int] = None,
+                   undirected: bool = False, weighted: bool = False) -> "CSRGraph":
+        """
+        Build from (u, v) or, with weighted=True, (u, v, w) tuples.
+
+        Edges are staged in typed arrays, not a list of tuples, so peak
+        memory while building is about 16-24 bytes per edge.
+
+        Args:
+            edges: Iterable of edge tuples
+            num_nodes: Node count, default max node ID + 1
+            undirected: Also add the reverse of every edge
+            weighted: Edges carry a third weight field
+        """
+        sources, targets = array("q"), array("q")
+        weights = array("d") if weighted else None
+        for edge in edges:
+            sources.append(edge[0])
+            targets.append(edge[1])
+            if weighted:
+                weights.append(edge[2])
+        if undirected:
+            sources, targets = sources + targets, targets + sources
+            if weighted:
+                weights = weights + weights
+        return cls.from_arrays(sources, targets, num_nodes, weights)
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[int, Iterable[int]],
+                       num_nodes: Optional[int] = None) -> "CSRGraph":
+        """Build from a dict-of-lists graph with integer nodes."""
+        return cls.from_edges(((u, v) for u, vs in graph.items() for v in vs), num_nodes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(num_nodes={self.num_nodes}, num_edges={self.num_edges})"
+
+    def degree(self, u: int) -> int:
+        """Out-degree of u."""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbors(self, u: int) -> memoryview:
+        """Out-neighbours of u as a zero-copy view into targets."""
+        return memoryview(self.targets)[self.offsets[u]:self.offsets[u + 1]]
+
+    def edges(self) -> Iterator[Tuple]:
+        """Yield (u, v) or (u, v, w) for every edge, grouped by source."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.num_nodes):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield (u, targets[i]) if weights is None else (u, targets[i], weights[i])
+
+    def transpose(self) -> "CSRGraph":
+        """Graph with every edge reversed."""
+        offsets = self.offsets
+        sources = array(self.targets.typecode, bytes(self.targets.itemsize * self.num_edges))
+        for u in range(self.num_nodes):
+            for i in range(offsets[u], offsets[u + 1]):
+                sources[i] = u
+        return CSRGraph.from_arrays(self.targets, sources, self.num_nodes, self.weights)
+
+    def bfs(self, source: int) -> Iterator[int]:
+        """Yield nodes reachable from source in breadth-first order."""
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(self.num_nodes)
+        queue = array(self.targets.typecode, bytes(self.targets.itemsize * self.num_nodes))
+        queue[0] = source
+        visited[source] = 1
+        head, tail = 0, 1
+        while head < tail:
+            u = queue[head]
+            head += 1
+            yield u
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if not visited[v]:
+                    visited[v] = 1
+                    queue[tail] = v
+                    tail += 1
+
+    def bfs_distances(self, source: int) -> array:
+        """Hop count from source to every node, -1 if unreachable."""
+        offsets, targets = self.offsets, self.targets
+        dist = array("q", [-1]) * self.num_nodes
+        dist[source] = 0
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for u in frontier:
+                d = dist[u] + 1
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if dist[v] < 0:
+                        dist[v] = d
+                        next_frontier.append(v)
+            frontier = next_frontier
+        return dist
+
+    def dfs(self, source: int) -> Iterator[int]:
+        """Yield nodes reachable from source in depth-first preorder."""
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(self.num_nodes)
+        visited[source] = 1
+        yield source
+        # Stack of (node, next edge position), each node pushed at most once
+        nodes = array(self.targets.typecode, [source])
+        positions = array("q", [offsets[source]])
+        while nodes:
+            u = nodes[-1]
+            i, end = positions[-1], offsets[u + 1]
+            while i < end and visited[targets[i]]:
+                i += 1
+            if i == end:
+                nodes.pop()
+                positions.pop()
+                continue
+            positions[-1] = i + 1
+            v = targets[i]
+            visited[v] = 1
+            yield v
+            nodes.append(v)
+            positions.append(offsets[v])
+
+
+def test_csr_graph():
+    """Test cases for the CSR graph."""
+    import random
+    from collections import deque
+
+    graph = CSRGraph.from_adjacency({0: [1, 2], 1: [3], 2: [3, 4], 3: [5], 4: [5], 5: []})
+    assert len(graph) == 6 and graph.num_edges == 7
+    assert list(graph.neighbors(2)) == [3, 4] and graph.degree(5) == 0
+    assert list(graph.bfs(0)) == [0, 1, 2, 3, 4, 5]
+    assert list(graph.dfs(0)) == [0, 1, 3, 5, 2, 4]
+    assert list(graph.bfs(4)) == [4, 5]
+    assert list(graph.bfs_distances(0)) == [0, 1, 1, 2, 2, 3]
+    assert list(graph.transpose().neighbors(3)) == [1, 2]
+    assert sorted(graph.transpose().transpose().edges()) == sorted(graph.edges())
+
+    # Weighted, undirected, isolated trailing nodes
+    graph = CSRGraph.from_edges([(0, 1, 2.5), (1, 2, 1.0)], num_nodes=5,
+                                undirected=True, weighted=True)
+    assert graph.num_edges == 4 and list(graph.neighbors(1)) == [2, 0]
+    assert sorted(graph.edges()) == [(0, 1, 2.5), (1, 0, 2.5), (1, 2, 1.0), (2, 1, 1.0)]
+    assert list(graph.bfs(4)) == [4] and graph.bfs_distances(0)[3] == -1
+    try:
+        CSRGraph.from_edges([(7, 0)], num_nodes=3)
+        assert False, "out-of-range node should be rejected"
+    except ValueError:
+        pass
+
+    # A complete graph: the template's bfs would enqueue n^2 entries
+    n = 200
+    complete = CSRGraph.from_edges((u, v) for u in range(n) for v in range(n) if u != v)
+    assert list(complete.bfs(0)) == list(range(n))
+    assert len(list(complete.dfs(0))) == n
+
+    # A long chain does not recurse
+    chain = CSRGraph.from_edges((i, i + 1) for i in range(100_000))
+    assert sum(1 for _ in chain.dfs(0)) == 100_001
+
+    # Randomised comparison against reference traversals on dicts
+    rng = random.Random(23)
+    n = 300
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(1200)]
+    graph = CSRGraph.from_edges(edges, num_nodes=n)
+    adj = {u: [] for u in range(n)}
+    for u, v in edges:
+        adj[u].append(v)
+
+    def reference_bfs(start):
+        seen, order, queue = {start}, [], deque([start])
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in adj[u]:
+                if v not in seen:
+                    seen.add(v)
+                    queue.append(v)
+        return order
+
+    def reference_dfs(u, seen, order):
+        seen.add(u)
+        order.append(u)
+        for v in adj[u]:
+            if v not in seen:
+                reference_dfs(v, seen, order)
+        return order
+
+    for start in range(0, n, 37):
+        assert list(graph.bfs(start)) == reference_bfs(start)
+        assert list(graph.dfs(start)) == reference_dfs(start, set(), [])
+
+    print("✅ All CSR graph tests passed!")
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    test_csr_graph()
+
+    # Benchmark: python csr_graph.py [edges]
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n = m // 10
+    rng = random.Random(0)
+    start = time.perf_counter()
+    graph = CSRGraph.from_edges(((rng.randrange(n), rng.randrange(n)) for _ in range(m)), n)
+    built = time.perf_counter() - start
+    size = sum(len(col) * col.itemsize for col in (graph.offsets, graph.targets))
+    print(f"{graph}: build {built:.2f}s, {size / 1e6:.1f} MB of columns")
+    for name in ("bfs", "dfs"):
+        start = time.perf_counter()
+        reached = sum(1 for _ in getattr(graph, name)(0))
+        print(f"  {name}: reached {reached:,} nodes in {time.perf_counter() - start:.2f}s")
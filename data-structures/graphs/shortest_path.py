@@ -0,0 +1,412 @@
+"""
+Shortest Path Algorithms
+========================
+
+Point-to-point and single-source shortest paths over two graph shapes:
+
+    - dict adjacency: weighted {u: [(v, w), ...]} for Dijkstra / A*,
+      plain {u: [v, ...]} for BFS
+    - CSRGraph (csr_graph.py): weights column if present, else weight 1;
+      distances and parents live in typed arrays instead of dicts
+
+Algorithms:
+    - dijkstra:            binary heap (heapq) with lazy deletion - stale
+                           entries are skipped when popped instead of
+                           being decreased in place
+    - astar:               Dijkstra ordered by g + h(node) for any
+                           admissible heuristic h
+    - bidirectional_bfs:   unweighted point-to-point search growing the
+                           smaller frontier from each end, one level at
+                           a time
+
+No per-node path lists are stored: every search records a parent pointer
+per reached node and ``reconstruct_path`` walks them back once.
+
+Operations and Time Complexity:
+    - dijkstra / astar:      O((V + E) log V)
+    - bidirectional_bfs:     O(V + E) worst case, typically ~O(b^(d/2))
+    - reconstruct_path:      O(path length)
+
+Space Complexity: O(V) for distances and parents
+"""
+
+import heapq
+from array import array
+from itertools import count, repeat
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+INF = float("inf")
+
+
+class _Distances(dict):
+    """Distance map where unreached nodes are infinitely far away."""
+
+    __slots__ = ()
+
+    def __missing__(self, node: Hashable) -> float:
+        return INF
+
+
+def _is_csr(graph: Any) -> bool:
+    return hasattr(graph, "offsets") and hasattr(graph, "targets")
+
+
+def _weighted_edges(graph: Any) -> Callable[[Any], Iterable[Tuple[Any, float]]]:
+    """Function mapping a node to its (neighbour, weight) pairs."""
+    if _is_csr(graph):
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        if weights is None:
+            return lambda u: zip(targets[offsets[u]:offsets[u + 1]], repeat(1))
+        return lambda u: zip(targets[offsets[u]:offsets[u + 1]],
+                             weights[offsets[u]:offsets[u + 1]])
+    empty = ()
+    get = graph.get
+    return lambda u: get(u, empty)
+
+
+def _neighbors(graph: Any) -> Callable[[Any], Iterable]:
+    if _is_csr(graph):
+        return graph.neighbors
+    empty = ()
+    get = graph.get
+    return lambda u: get(u, empty)
+
+
+def _new_state(graph: Any) -> Tuple[Any, Any]:
+    """Empty (distances, parents) containers for graph."""
+    if _is_csr(graph):
+        return array("d", [INF]) * graph.num_nodes, array("q", [-1]) * graph.num_nodes
+    return _Distances(), {}
+
+
+def reconstruct_path(parent: Any, source: Hashable, target: Hashable) -> Optional[List[Hashable]]:
+    """
+    Walk parent pointers back from target.
+
+    Args:
+        parent: Parent map / array from a search rooted at source
+        source: Start node
+        target: Node to walk back from
+
+    Returns:
+        [source, ..., target], or None if the search never reached target
+    """
+    # Unreached nodes have no dict entry; CSR parent arrays hold -1
+    missing = None if isinstance(parent, dict) else -1
+    lookup = parent.get if missing is None else parent.__getitem__
+    path = [target]
+    node = target
+    while node != source:
+        node = lookup(node)
+        if node == missing:
+            return None
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def dijkstra(graph: Any, source: Hashable, target: Optional[Hashable] = None) -> Tuple[Any, Any]:
+    """
+    Single-source shortest paths with non-negative weights.
+
+    Args:
+        graph: Weighted dict adjacency or CSRGraph
+        source: Start node
+        target: Stop as soon as this node is settled
+
+    Returns:
+        (dist, parent) - dist[v] is INF for unreached nodes; for CSR graphs
+        both are arrays indexed by node, otherwise dicts
+    """
+    edges = _weighted_edges(graph)
+    dist, parent = _new_state(graph)
+    dist[source] = 0
+    # The counter breaks distance ties, so nodes themselves are never compared
+    tie = count()
+    heap = [(0, next(tie), source)]
+    pop, push = heapq.heappop, heapq.heappush
+    while heap:
+        d, _, u = pop(heap)
+        if d > dist[u]:
+            continue  # Stale entry: u was already settled with a shorter distance
+        if u == target:
+            break
+        for v, w in edges(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                push(heap, (nd, next(tie), v))
+    return dist, parent
+
+
+def shortest_path(graph: Any, source: Hashable, target: Hashable
+                  ) -> Tuple[float, Optional[List[Hashable]]]:
+    """Dijkstra point-to-point: (distance, path), or (INF, None) if unreachable."""
+    dist, parent = dijkstra(graph, source, target)
+    if dist[target] == INF:
+        return INF, None
+    return dist[target], reconstruct_path(parent, source, target)
+
+
+def astar(graph: Any, source: Hashable, target: Hashable,
+          heuristic: Callable[[Hashable], float]) -> Tuple[float, Optional[List[Hashable]]]:
+    """
+    A* search from source to target.
+
+    Args:
+        graph: Weighted dict adjacency or CSRGraph
+        source: Start node
+        target: Goal node
+        heuristic: Lower bound on the remaining distance from a node to
+                   target; lambda u: 0 turns this into Dijkstra
+
+    Returns:
+        (distance, path), or (INF, None) if target is unreachable
+    """
+    edges = _weighted_edges(graph)
+    dist, parent = _new_state(graph)
+    dist[source] = 0
+    tie = count()
+    heap = [(heuristic(source), 0, next(tie), source)]
+    pop, push = heapq.heappop, heapq.heappush
+    while heap:
+        _, g, _, u = pop(heap)
+        if g > dist[u]:
+            continue
+        if u == target:
+            return g, reconstruct_path(parent, source, target)
+        for v, w in edges(u):
+            ng = g + w
+            if ng < dist[v]:
+                dist[v] = ng
+                parent[v] = u
+                push(heap, (ng + heuristic(v), ng, next(tie), v))
+    return INF, None
+
+
+def bidirectional_bfs(graph: Any, source: Hashable, target: Hashable,
+                      reverse: Any = None) -> Optional[List[Hashable]]:
+    """
+    Fewest-edges path between two nodes, searching from both ends.
+
+    Args:
+        graph: Dict adjacency or CSRGraph
+        source: Start node
+        target: Goal node
+        reverse: Graph with every edge reversed (e.g. CSRGraph.transpose())
+                 for directed graphs; None means graph is undirected
+
+    Returns:
+        [source, ..., target], or None if target is unreachable
+    """
+    if source == target:
+        return [source]
+    forward = _neighbors(graph)
+    backward = _neighbors(graph if reverse is None else reverse)
+    parents = ({source: None}, {target: None})
+    frontiers = ([source], [target])
+
+    while frontiers[0] and frontiers[1]:
+        # Expand one whole level of the smaller frontier; the first meeting
+        # found that way is already a shortest path
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        step = forward if side == 0 else backward
+        mine, other = parents[side], parents[1 - side]
+        next_frontier = []
+        for u in frontiers[side]:
+            for v in step(u):
+                if v in mine:
+                    continue
+                mine[v] = u
+                if v in other:
+                    return _join(parents, v)
+                next_frontier.append(v)
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+    return None
+
+
+def _join(parents: Tuple[Dict, Dict], meet: Hashable) -> List[Hashable]:
+    """Stitch source -> meet and meet -> target from both parent maps."""
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = parents[0][node]
+    path.reverse()
+    node = parents[1][meet]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return path
+
+
+def grid_graph(width: int, height: int, seed: int = 0, max_weight: int = 10):
+    """Undirected 4-neighbour grid as a weighted CSRGraph; node = y * width + x."""
+    import random
+    from csr_graph import CSRGraph
+
+    rng = random.Random(seed)
+
+    def edges():
+        for y in range(height):
+            for x in range(width):
+                u = y * width + x
+                if x + 1 < width:
+                    yield u, u + 1, rng.randint(1, max_weight)
+                if y + 1 < height:
+                    yield u, u + width, rng.randint(1, max_weight)
+
+    return CSRGraph.from_edges(edges(), width * height, undirected=True, weighted=True)
+
+
+def power_law_graph(n: int, m: int = 3, seed: int = 0):
+    """Undirected preferential-attachment (Barabasi-Albert style) CSRGraph."""
+    import random
+    from csr_graph import CSRGraph
+
+    rng = random.Random(seed)
+    endpoints = array("q", range(m))  # Each node appears once per incident edge
+    sources, targets = array("q"), array("q")
+    for u in range(m, n):
+        chosen = {endpoints[rng.randrange(len(endpoints))] for _ in range(m)}
+        for v in chosen:
+            sources.append(u)
+            targets.append(v)
+            endpoints.append(u)
+            endpoints.append(v)
+    return CSRGraph.from_arrays(sources + targets, targets + sources, n)
+
+
+def benchmark(side: int = 300, n: int = 100_000, queries: int = 20) -> None:
+    """Point-to-point queries on a synthetic grid and a power-law graph."""
+    import random
+    import time
+
+    def timed(label, fn, pairs):
+        start = time.perf_counter()
+        for s, t in pairs:
+            fn(s, t)
+        per_query = (time.perf_counter() - start) / len(pairs)
+        print(f"  {label:>24}: {per_query * 1e3:>9.2f} ms/query")
+
+    rng = random.Random(1)
+    grid = grid_graph(side, side)
+    pairs = [(rng.randrange(side * side), rng.randrange(side * side)) for _ in range(queries)]
+
+    def manhattan_to(t):
+        tx, ty = t % side, t // side
+        return lambda u: abs(u % side - tx) + abs(u // side - ty)  # Weights are >= 1
+
+    print(f"{side}x{side} grid: {grid}")
+    timed("dijkstra", lambda s, t: shortest_path(grid, s, t), pairs)
+    timed("astar (manhattan)", lambda s, t: astar(grid, s, t, manhattan_to(t)), pairs)
+    timed("bidirectional_bfs (hops)", lambda s, t: bidirectional_bfs(grid, s, t), pairs)
+
+    graph = power_law_graph(n)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"power-law graph: {graph}")
+    timed("dijkstra (unit weights)", lambda s, t: shortest_path(graph, s, t), pairs)
+    timed("bfs_distances (full)", lambda s, t: graph.bfs_distances(s), pairs)
+    timed("bidirectional_bfs", lambda s, t: bidirectional_bfs(graph, s, t), pairs)
+
+
+def test_shortest_path():
+    """Test cases for the shortest path algorithms."""
+    import random
+
+    from csr_graph import CSRGraph
+
+    graph = {
+        "A": [("B", 4), ("C", 1)],
+        "B": [("D", 1)],
+        "C": [("B", 2), ("D", 5)],
+        "D": [("E", 3)],
+        "E": [],
+        "F": [("A", 1)],
+    }
+    dist, parent = dijkstra(graph, "A")
+    assert dict(dist) == {"A": 0, "B": 3, "C": 1, "D": 4, "E": 7}
+    assert reconstruct_path(parent, "A", "E") == ["A", "C", "B", "D", "E"]
+    assert shortest_path(graph, "A", "D") == (4, ["A", "C", "B", "D"])
+    assert shortest_path(graph, "A", "F") == (INF, None)
+    assert astar(graph, "A", "E", lambda u: 0) == (7, ["A", "C", "B", "D", "E"])
+    assert astar(graph, "E", "A", lambda u: 0) == (INF, None)
+
+    assert reconstruct_path(parent, "A", "F") is None
+
+    # Unreached targets on CSR graphs: parent holds -1, which must not wrap
+    split = CSRGraph.from_edges([(0, 1), (2, 3)])
+    _, csr_parent = dijkstra(split, 0)
+    assert reconstruct_path(csr_parent, 0, 3) is None
+    assert reconstruct_path(csr_parent, 0, 1) == [0, 1]
+    assert shortest_path(split, 0, 3) == (INF, None)
+
+    # Equal distances never compare the nodes themselves
+    class Place:
+        def __init__(self, name):
+            self.name = name
+
+    a, b, c, d = (Place(x) for x in "abcd")
+    places = {a: [(b, 1), (c, 1)], b: [(d, 1)], c: [(d, 1)]}
+    cost, path = shortest_path(places, a, d)
+    assert cost == 2 and path[0] is a and path[-1] is d
+    assert astar(places, a, d, lambda u: 0)[0] == 2
+
+    unweighted = {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": ["E"], "E": []}
+    reverse = {"B": ["A"], "C": ["A"], "D": ["B", "C"], "E": ["D"]}
+    assert bidirectional_bfs(unweighted, "A", "E", reverse) == ["A", "B", "D", "E"]
+    assert bidirectional_bfs(unweighted, "E", "A", {v: [] for v in "ABCDE"}) is None
+    assert bidirectional_bfs(unweighted, "C", "C") == ["C"]
+
+    # Grid: dijkstra, A* and a brute-force Bellman-Ford agree
+    side = 12
+    grid = grid_graph(side, side, seed=25)
+    n = side * side
+    relaxed = [INF] * n
+    relaxed[0] = 0
+    for _ in range(n):
+        for u, v, w in grid.edges():
+            relaxed[v] = min(relaxed[v], relaxed[u] + w)
+    dist, parent = dijkstra(grid, 0)
+    assert list(dist) == relaxed
+    weight = {(u, v): w for u, v, w in grid.edges()}
+    for t in range(0, n, 13):
+        path = reconstruct_path(parent, 0, t)
+        assert sum(weight[a, b] for a, b in zip(path, path[1:])) == relaxed[t]
+        tx, ty = t % side, t // side
+        cost, a_path = astar(grid, 0, t, lambda u: abs(u % side - tx) + abs(u // side - ty))
+        assert cost == relaxed[t] and a_path[0] == 0 and a_path[-1] == t
+
+    # Bidirectional BFS path lengths match plain BFS, on dict and CSR graphs
+    rng = random.Random(25)
+    graph = power_law_graph(500, m=2, seed=25)
+    directed = CSRGraph.from_edges((rng.randrange(300), rng.randrange(300)) for _ in range(900))
+    transposed = directed.transpose()
+    as_dict = {u: list(directed.neighbors(u)) for u in range(directed.num_nodes)}
+    for _ in range(50):
+        s, t = rng.randrange(300), rng.randrange(300)
+        hops = directed.bfs_distances(s)[t]
+        for path in (bidirectional_bfs(directed, s, t, transposed),
+                     bidirectional_bfs(as_dict, s, t, transposed)):
+            if hops < 0:
+                assert path is None
+            else:
+                assert len(path) == hops + 1 and path[0] == s and path[-1] == t
+                assert all(b in as_dict[a] for a, b in zip(path, path[1:]))
+        s, t = rng.randrange(500), rng.randrange(500)
+        assert len(bidirectional_bfs(graph, s, t)) == graph.bfs_distances(s)[t] + 1
+        assert shortest_path(graph, s, t)[0] == graph.bfs_distances(s)[t]
+
+    print("✅ All shortest path tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_shortest_path()
+
+    # Benchmark: python shortest_path.py [grid side] [power-law nodes]
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    benchmark(side, n)
@@ -0,0 +1,349 @@
+"""
+Hash Table (Open Addressing) Implementation
+===========================================
+
+A hash map with the same "compact" layout CPython's dict uses:
+
+    - entries live in dense, insertion-ordered columns
+      (``_hashes`` as an int64 array, ``_keys`` and ``_values`` as lists)
+    - a sparse index table maps probe slots to entry positions; it is an
+      ``array`` whose item width grows with the table (1, 2, 4 or 8 bytes)
+
+Collisions are resolved with linear probing. The probe start is a
+Fibonacci (multiplicative) hash of ``hash(key)``: Python hashes ints to
+themselves, so masking the raw hash would pile strided integer keys into
+one cluster and make probing quadratic. Deleting leaves a tombstone
+in the index table (so probe chains stay intact) and a hole in the dense
+columns; both are cleaned up by the next rebuild, which happens when
+used + tombstone slots pass the 2/3 load factor, when the dense columns
+reach the slot count (so every position fits the index width) or when
+most dense entries are holes.
+
+Operations and Time Complexity:
+    - Put / get / remove:   O(1) expected, amortized over resizes
+    - Iteration:            O(n) in insertion order
+    - Resize / cleanup:     O(n)
+
+Space Complexity: O(n), about 8 bytes per hash plus 1-8 bytes per index
+slot on top of the key and value references
+"""
+
+from array import array
+from typing import Any, Hashable, Iterator, Tuple
+
+EMPTY = -1
+DUMMY = -2                   # Tombstone: slot was used, keep probing past it
+MIN_SIZE = 8
+_FIB = 0x9E3779B97F4A7C15    # 2**64 / golden ratio
+_MASK64 = (1 << 64) - 1
+_DELETED = object()          # Hole left in the dense columns by remove()
+_MISSING = object()
+
+
+def _index_array(size: int) -> array:
+    """Smallest signed typecode that can address size entries."""
+    for code in ("b", "h", "i", "q"):
+        if size <= 2 ** (8 * array(code).itemsize - 1) - 1:
+            return array(code, [EMPTY]) * size
+    raise OverflowError("hash table too large")
+
+
+class HashTable:
+    """Open-addressing hash map that preserves insertion order."""
+
+    def __init__(self, size: int = MIN_SIZE):
+        self._build(max(size, MIN_SIZE))
+
+    def _build(self, min_size: int) -> None:
+        size = MIN_SIZE
+        while size < min_size:
+            size <<= 1
+        self._mask = size - 1
+        self._shift = 64 - size.bit_length() + 1   # Keep the top log2(size) bits
+        self._indices = _index_array(size)
+        self._hashes = array("q")
+        self._keys: list = []
+        self._values: list = []
+        self._len = 0
+        self._fill = 0       # Used + tombstone slots in _indices
+
+    @property
+    def size(self) -> int:
+        """Number of slots in the index table."""
+        return self._mask + 1
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return "HashTable({" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "})"
+
+    def _lookup(self, key: Hashable, h: int) -> Tuple[int, int]:
+        """
+        Probe for key.
+
+        Returns:
+            (slot, entry) - entry is the dense position, or -1 when absent,
+            in which case slot is where the key should be inserted
+        """
+        indices, hashes, keys, mask = self._indices, self._hashes, self._keys, self._mask
+        free = -1
+        i = ((h * _FIB) & _MASK64) >> self._shift
+        while True:
+            ix = indices[i]
+            if ix == EMPTY:
+                return (i if free < 0 else free), -1
+            if ix == DUMMY:
+                if free < 0:
+                    free = i
+            elif hashes[ix] == h:
+                k = keys[ix]
+                if k is key or k == key:
+                    return i, ix
+            i = (i + 1) & mask
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert key, or replace its value if it already exists."""
+        h = hash(key)
+        slot, ix = self._lookup(key, h)
+        if ix >= 0:
+            self._values[ix] = value
+            return
+        if self._indices[slot] == EMPTY:
+            self._fill += 1
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(h)
+        self._keys.append(key)
+        self._values.append(value)
+        self._len += 1
+        # Re-inserting into tombstones grows the dense columns without
+        # raising _fill; rebuild before a position outgrows the index width
+        if 3 * self._fill >= 2 * self.size or len(self._keys) >= self.size:
+            self._resize()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key, or default if absent."""
+        _, ix = self._lookup(key, hash(key))
+        return default if ix < 0 else self._values[ix]
+
+    def remove(self, key: Hashable) -> bool:
+        """Delete key. Returns True if found."""
+        slot, ix = self._lookup(key, hash(key))
+        if ix < 0:
+            return False
+        self._indices[slot] = DUMMY
+        self._keys[ix] = _DELETED
+        self._values[ix] = None
+        self._len -= 1
+        # Shrink once holes dominate the dense columns
+        if len(self._keys) > MIN_SIZE and 4 * self._len < len(self._keys):
+            self._resize()
+        return True
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Remove key and return its value."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self.remove(key)
+        return value
+
+    def _resize(self) -> None:
+        """Rebuild for the live entries only, dropping tombstones and holes."""
+        live = [(h, k, v) for h, k, v in zip(self._hashes, self._keys, self._values)
+                if k is not _DELETED]
+        self._build(3 * len(live))
+        indices, mask, shift = self._indices, self._mask, self._shift
+        for ix, (h, k, v) in enumerate(live):
+            i = ((h * _FIB) & _MASK64) >> shift
+            while indices[i] != EMPTY:
+                i = (i + 1) & mask
+            indices[i] = ix
+            self._hashes.append(h)
+            self._keys.append(k)
+            self._values.append(v)
+        self._len = self._fill = len(live)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if not self.remove(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key, hash(key))[1] >= 0
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for key in self._keys:
+            if key is not _DELETED:
+                yield key
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield value
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield key, value
+
+
+def benchmark(n: int = 200_000) -> None:
+    """Insert, lookup and delete-heavy workloads against dict."""
+    import random
+    import time
+
+    rng = random.Random(0)
+    keys = [rng.getrandbits(48) for _ in range(n)]
+    probes = [rng.choice(keys) if rng.random() < 0.5 else rng.getrandbits(48) for _ in range(n)]
+    churn = [(rng.random() < 0.5, rng.randrange(n // 10)) for _ in range(n)]
+
+    def insert(table):
+        for k in keys:
+            table[k] = k
+
+    def lookup(table):
+        get = table.get
+        for k in probes:
+            get(k)
+
+    def delete_heavy(table):
+        # Working set of n/10 keys, half of all operations are deletes
+        for is_delete, k in churn:
+            if is_delete:
+                table.pop(k, None)
+            else:
+                table[k] = k
+
+    print(f"n={n:,}")
+    for name, workload, prepare in (("insert", insert, False), ("lookup", lookup, True),
+                                    ("delete-heavy", delete_heavy, False)):
+        for label, factory in (("HashTable", HashTable), ("dict", dict)):
+            table = factory()
+            if prepare:
+                insert(table)
+            start = time.perf_counter()
+            workload(table)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:>12} {label:>10}: {n / elapsed:>12,.0f} ops/sec")
+
+
+def test_hash_table():
+    """Test cases for the hash table."""
+    import random
+
+    ht = HashTable()
+    ht.put("name", "Alice")
+    ht.put("age", 25)
+    assert ht.get("name") == "Alice" and ht["age"] == 25 and ht.get("x") is None
+    ht["name"] = "Bob"
+    assert len(ht) == 2 and list(ht.items()) == [("name", "Bob"), ("age", 25)]
+    assert ht.remove("name") and not ht.remove("name") and "name" not in ht
+    try:
+        ht["name"]
+        assert False, "missing key should raise"
+    except KeyError:
+        pass
+
+    # Grows past the initial size and keeps insertion order
+    ht = HashTable()
+    for i in range(1000):
+        ht[i] = i * i
+    assert len(ht) == 1000 and ht.size >= 1500
+    assert list(ht) == list(range(1000)) and ht[999] == 999 ** 2
+    assert ht._indices.typecode == "h"
+
+    # Strided and power-of-two integer keys must not cluster: with the raw
+    # hash as probe start, stride 2**20 took tens of seconds for 20k keys
+    for stride in (1, 4096, 2 ** 20, 2 ** 32):
+        ht = HashTable()
+        for i in range(20000):
+            ht[i * stride] = i
+        probes = 0
+        for i in range(20000):
+            h = hash(i * stride)
+            j = ((h * _FIB) & _MASK64) >> ht._shift
+            while ht._indices[j] != i:
+                j = (j + 1) & ht._mask
+                probes += 1
+        assert probes < 20000 * 2, f"stride {stride}: {probes} extra probes"
+        assert ht[19999 * stride] == 19999
+
+    # Delete / re-insert churn reuses tombstones and keeps appending dense
+    # entries; positions used to overflow the 'h' index and lose the key
+    ht = HashTable(16384)
+    ref = {}
+    for i in range(10900):
+        ht[i] = ref[i] = i
+    assert ht._indices.typecode == "h"
+    for r in range(40000):
+        k = r % 10900
+        del ht[k]
+        ht[k] = ref[k] = r
+        assert len(ht._keys) <= ht.size
+    assert dict(ht.items()) == ref
+
+    # Colliding hashes and tombstones on a shared probe chain
+    class Collide:
+        def __init__(self, n):
+            self.n = n
+
+        def __hash__(self):
+            return 42
+
+        def __eq__(self, other):
+            return isinstance(other, Collide) and self.n == other.n
+
+    ht = HashTable()
+    items = [Collide(i) for i in range(4)]
+    for item in items:
+        ht[item] = item.n
+    del ht[items[1]]
+    assert ht[items[3]] == 3 and Collide(1) not in ht
+    ht[Collide(1)] = "again"  # Reuses the tombstone slot
+    assert [k.n for k in ht] == [0, 2, 3, 1] and ht._fill == 4
+
+    # Delete-heavy churn keeps the table bounded
+    ht = HashTable()
+    for i in range(10000):
+        ht[i] = i
+        if i >= 10:
+            del ht[i - 10]
+    assert len(ht) == 10 and ht.size <= 64 and len(ht._keys) < 64
+    assert list(ht.values()) == list(range(9990, 10000))
+
+    # Randomised comparison against dict
+    rng = random.Random(21)
+    ht, ref = HashTable(), {}
+    for _ in range(20000):
+        key = rng.choice([rng.randrange(500), str(rng.randrange(100)), (rng.randrange(5),)])
+        if rng.random() < 0.6:
+            ht[key] = ref[key] = rng.random()
+        else:
+            assert ht.pop(key, None) == ref.pop(key, None)
+        assert (key in ht) == (key in ref)
+    assert len(ht) == len(ref) and list(ht.items()) == list(ref.items())
+
+    print("✅ All hash table tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_hash_table()
+
+    # Benchmark: python hash_table.py [n]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
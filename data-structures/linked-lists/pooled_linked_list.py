@@ -0,0 +1,355 @@
+"""
+Pooled Singly Linked List Implementation
+========================================
+
+A singly linked list without per-element Node objects. Elements live in
+a node pool made of parallel columns: ``data[i]`` holds the value and
+``next[i]`` the index of the following slot (-1 ends the list). Deleted
+slots go on a free-list (threaded through the ``next`` column) and are
+reused by later inserts; ``compact()`` rewrites the pool in list order
+and drops unused slots.
+
+``search()`` returns a ``PooledNode`` handle (always truthy, with
+``data`` and ``next`` like ``Node``) rather than a bare slot index, so
+``if ll.search(x):`` behaves as it does on ``LinkedList`` even for slot 0.
+A handle is only valid until the next delete or compact.
+
+With a typecode (e.g. 'q') the data column is an ``array.array`` too, so
+the whole list is two flat buffers: 16 bytes per element and nothing for
+the garbage collector to track.
+
+Operations and Time Complexity:
+    - Insert at head:  O(1) amortized
+    - Insert at tail:  O(1) amortized
+    - Delete:          O(n)
+    - Search:          O(n)
+    - Reverse:         O(n)
+    - Compact:         O(capacity)
+
+Space Complexity: O(capacity), capacity >= n
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator, Optional
+
+NIL = -1
+
+
+class PooledNode:
+    """Handle to one slot of a PooledLinkedList, the analogue of Node."""
+
+    __slots__ = ("_pool", "slot")
+
+    def __init__(self, pool: "PooledLinkedList", slot: int):
+        self._pool = pool
+        self.slot = slot
+
+    @property
+    def data(self) -> Any:
+        return self._pool._data[self.slot]
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._pool._data[self.slot] = value
+
+    @property
+    def next(self) -> Optional["PooledNode"]:
+        slot = self._pool._next[self.slot]
+        return None if slot == NIL else PooledNode(self._pool, slot)
+
+    def __repr__(self) -> str:
+        return f"PooledNode({self.data!r})"
+
+
+class PooledLinkedList:
+    """Singly linked list backed by array columns instead of Node objects."""
+
+    def __init__(self, typecode: Optional[str] = None):
+        self._typecode = typecode
+        self._data = array(typecode) if typecode else []
+        self._next = array("q")
+        self._head = NIL
+        self._tail = NIL
+        self._free = NIL
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any],
+                      typecode: Optional[str] = None) -> "PooledLinkedList":
+        """Build a list from any iterable in one pass. O(n)"""
+        ll = cls(typecode)
+        ll.extend(iterable)
+        return ll
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        data, nxt = self._data, self._next
+        slot = self._head
+        while slot != NIL:
+            yield data[slot]
+            slot = nxt[slot]
+
+    def __repr__(self) -> str:
+        if self._head == NIL:
+            return "PooledLinkedList(empty)"
+        return "PooledLinkedList(" + " -> ".join(map(str, self)) + ")"
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the pool, including free ones."""
+        return len(self._next)
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty."""
+        return self._head == NIL
+
+    def _allocate(self, data: Any) -> int:
+        """
+        Take a slot from the free-list, or grow the pool by one.
+
+        The value is stored before any bookkeeping changes, so a value the
+        typed column rejects (TypeError, OverflowError) or a failed growth
+        leaves the free-list and both columns as they were.
+        """
+        slot = self._free
+        if slot != NIL:
+            self._data[slot] = data
+            self._free = self._next[slot]
+            self._next[slot] = NIL
+        else:
+            slot = len(self._next)
+            self._data.append(data)
+            try:
+                self._next.append(NIL)
+            except BaseException:
+                self._data.pop()
+                raise
+        self._size += 1
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Return a slot to the free-list."""
+        # Drop the reference so the value can be collected
+        self._data[slot] = 0 if self._typecode else None
+        self._next[slot] = self._free
+        self._free = slot
+        self._size -= 1
+
+    def insert_at_head(self, data: Any) -> None:
+        """Insert a new element at the beginning. O(1)"""
+        slot = self._allocate(data)
+        self._next[slot] = self._head
+        self._head = slot
+        if self._tail == NIL:
+            self._tail = slot
+
+    def insert_at_tail(self, data: Any) -> None:
+        """Insert a new element at the end. O(1)"""
+        slot = self._allocate(data)
+        if self._head == NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of iterable at the end. O(k)"""
+        for data in iterable:
+            self.insert_at_tail(data)
+
+    def delete(self, data: Any) -> bool:
+        """Delete first occurrence of data. Returns True if found."""
+        values, nxt = self._data, self._next
+        prev, slot = NIL, self._head
+
+        while slot != NIL:
+            if values[slot] == data:
+                following = nxt[slot]
+                if prev == NIL:
+                    self._head = following
+                else:
+                    nxt[prev] = following
+                if slot == self._tail:
+                    self._tail = prev
+                self._release(slot)
+                return True
+            prev, slot = slot, nxt[slot]
+
+        return False
+
+    def search(self, data: Any) -> Optional[PooledNode]:
+        """
+        Search for an element with given data. O(n)
+
+        Returns:
+            A PooledNode handle for the first match (valid until the next
+            delete or compact), None if not found
+        """
+        values, nxt = self._data, self._next
+        slot = self._head
+        while slot != NIL:
+            if values[slot] == data:
+                return PooledNode(self, slot)
+            slot = nxt[slot]
+        return None
+
+    def to_list(self) -> list:
+        """Convert linked list to Python list."""
+        return list(self)
+
+    def reverse(self) -> None:
+        """Reverse the linked list in place. O(n)"""
+        nxt = self._next
+        prev, slot = NIL, self._head
+        self._tail = slot
+
+        while slot != NIL:
+            following = nxt[slot]
+            nxt[slot] = prev
+            prev, slot = slot, following
+
+        self._head = prev
+
+    def compact(self) -> None:
+        """
+        Rebuild the pool in list order without free slots. O(capacity)
+
+        Afterwards slot i holds the i-th element, so traversal walks
+        memory sequentially. Handles returned by search() become invalid.
+        """
+        values = list(self) if self._typecode is None else array(self._typecode, self)
+        n = len(values)
+        self._data = values
+        self._next = array("q", range(1, n + 1))
+        if n:
+            self._next[-1] = NIL
+        self._head = 0 if n else NIL
+        self._tail = n - 1 if n else NIL
+        self._free = NIL
+
+
+def benchmark_memory(n: int = 1_000_000) -> None:
+    """Compare memory used to hold n integers against the Node-based LinkedList."""
+    import gc
+    import time
+    import tracemalloc
+
+    from singly_linked_list import LinkedList
+
+    builders = (
+        ("LinkedList", lambda: LinkedList.from_iterable(range(n))),
+        ("PooledLinkedList", lambda: PooledLinkedList.from_iterable(range(n))),
+        ("PooledLinkedList('q')", lambda: PooledLinkedList.from_iterable(range(n), "q")),
+    )
+    print(f"Building {n:,} element lists")
+    for name, build in builders:
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        ll = build()
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {name:>22}: {current / n:6.1f} bytes/element, built in {elapsed:.2f}s")
+        del ll
+
+
+def test_pooled_linked_list():
+    """Test cases for pooled linked list."""
+    for typecode in (None, "q"):
+        ll = PooledLinkedList(typecode)
+
+        # Test empty list
+        assert ll.is_empty()
+        assert len(ll) == 0
+
+        # Test insertions
+        ll.insert_at_head(3)
+        ll.insert_at_head(2)
+        ll.insert_at_head(1)
+        ll.insert_at_tail(4)
+        ll.insert_at_tail(5)
+        assert ll.to_list() == [1, 2, 3, 4, 5]
+
+        # Test search
+        assert ll.search(3) is not None
+        assert ll.search(10) is None
+        # Truthy even for slot 0, like LinkedList.search's Node
+        first = ll.search(3)
+        assert first and first.slot == 0 and first.data == 3
+        assert ll.search(1).next.data == 2 and ll.search(5).next is None
+        first.data = 30
+        assert ll.to_list() == [1, 2, 30, 4, 5]
+        first.data = 3
+
+        # Test delete (middle, head, tail) and slot reuse
+        assert ll.delete(3) is True
+        assert ll.delete(1) is True
+        assert ll.delete(5) is True
+        assert ll.delete(42) is False
+        assert ll.to_list() == [2, 4] and len(ll) == 2
+        ll.insert_at_tail(6)
+        ll.insert_at_head(0)
+        assert ll.to_list() == [0, 2, 4, 6]
+        assert ll.capacity == 5
+
+        # Test reverse keeps the tail usable
+        ll.reverse()
+        assert ll.to_list() == [6, 4, 2, 0]
+        ll.insert_at_tail(-1)
+        assert ll.to_list() == [6, 4, 2, 0, -1]
+
+        # Test compaction
+        ll.delete(4)
+        ll.delete(0)
+        ll.compact()
+        assert ll.capacity == 3 and ll.to_list() == [6, 2, -1]
+        ll.insert_at_tail(9)
+        assert ll.to_list() == [6, 2, -1, 9]
+
+        # Emptying and refilling
+        for value in ll.to_list():
+            ll.delete(value)
+        assert ll.is_empty()
+        ll.compact()
+        ll.insert_at_tail(1)
+        assert ll.to_list() == [1]
+
+    # Rejected values must not leak free slots or desync the columns
+    ll = PooledLinkedList.from_iterable([1, 2, 3], "q")
+    ll.delete(2)
+    for bad in ("x", 2 ** 70):
+        for insert in (ll.insert_at_head, ll.insert_at_tail):
+            try:
+                insert(bad)
+                assert False, "typed pool should reject the value"
+            except (TypeError, OverflowError):
+                pass
+    assert ll.to_list() == [1, 3] and len(ll) == 2 and ll._free != NIL
+    ll.insert_at_tail(4)  # Reuses the freed slot
+    assert ll.capacity == 3 and ll._free == NIL
+    for bad in ("x", 2 ** 70):
+        try:
+            ll.insert_at_tail(bad)
+            assert False, "typed pool should reject the value"
+        except (TypeError, OverflowError):
+            pass
+    assert ll.capacity == 3 and len(ll._data) == len(ll._next) == 3
+    ll.insert_at_tail(5)
+    assert ll.to_list() == [1, 3, 4, 5] and ll.capacity == 4
+
+    ll = PooledLinkedList.from_iterable(["a", "b"])
+    assert repr(ll) == "PooledLinkedList(a -> b)"
+
+    print("✅ All pooled linked list tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_pooled_linked_list()
+
+    # Memory benchmark: python pooled_linked_list.py [n]
+    benchmark_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -6,20 +6,26 @@ A basic linked list with common operations.
 
 Operations and Time Complexity:
     - Insert at head:  O(1)
-    - Insert at tail:  O(n) or O(1) with tail pointer
+    - Insert at tail:  O(1) (tail pointer)
+    - Extend:          O(k) for k new items
     - Delete:          O(n)
+    - Bulk delete:     O(n) single pass (delete_where / remove_all / dedupe)
+    - Splice:          O(1)
+    - Split at index:  O(index)
     - Search:          O(n)
     - Access by index: O(n)
 
 Space Complexity: O(n)
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 
 class Node:
     """A node in the linked list."""
     
+    __slots__ = ("data", "next")
+    
     def __init__(self, data: Any):
         self.data = data
         self.next: Optional['Node'] = None
@@ -33,11 +39,25 @@ class LinkedList:
     
     def __init__(self):
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None
         self._size = 0
     
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> "LinkedList":
+        """Build a list from any iterable in one pass. O(n)"""
+        ll = cls()
+        ll.extend(iterable)
+        return ll
+    
     def __len__(self) -> int:
         return self._size
     
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+    
     def __repr__(self) -> str:
         if not self.head:
             return "LinkedList(empty)"
@@ -59,22 +79,43 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self._size += 1
     
     def insert_at_tail(self, data: Any) -> None:
-        """Insert a new node at the end. O(n)"""
+        """Insert a new node at the end. O(1)"""
         new_node = Node(data)
         
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
         
+        self.tail = new_node
         self._size += 1
     
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of iterable at the end. O(k)"""
+        # Link a detached chain first, then splice it on in one step
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for data in iterable:
+            node = Node(data)
+            last.next = node
+            last = node
+            count += 1
+        
+        if not count:
+            return
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = last
+        self._size += count
+    
     def delete(self, data: Any) -> bool:
         """Delete first occurrence of data. Returns True if found."""
         if not self.head:
@@ -83,6 +124,8 @@ class LinkedList:
         # Special case: delete head
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
             self._size -= 1
             return True
         
@@ -90,6 +133,8 @@ class LinkedList:
         current = self.head
         while current.next:
             if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
                 self._size -= 1
                 return True
@@ -97,6 +142,90 @@ class LinkedList:
         
         return False
     
+    def delete_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Delete every node whose data matches predicate. Returns count. O(n)
+        
+        If predicate raises, the nodes already unlinked stay deleted and
+        head / size are committed before the exception propagates.
+        """
+        dummy = Node(None)
+        dummy.next = self.head
+        prev = dummy
+        current = self.head
+        removed = 0
+        
+        try:
+            while current:
+                if predicate(current.data):
+                    prev.next = current.next
+                    removed += 1
+                else:
+                    prev = current
+                current = current.next
+        finally:
+            self.head = dummy.next
+            self._size -= removed
+        # Only reached after a full pass; on error the old tail is still linked
+        self.tail = prev if self.head else None
+        return removed
+    
+    def remove_all(self, values: Iterable[Any]) -> int:
+        """Delete every node whose data is in values (hashable). Returns count. O(n + k)"""
+        targets = set(values)
+        return self.delete_where(targets.__contains__)
+    
+    def dedupe(self) -> int:
+        """Keep only the first occurrence of each (hashable) value. Returns count. O(n)"""
+        seen = set()
+        
+        def is_duplicate(data: Any) -> bool:
+            if data in seen:
+                return True
+            seen.add(data)
+            return False
+        
+        return self.delete_where(is_duplicate)
+    
+    def splice(self, other: "LinkedList") -> None:
+        """Move all nodes of other to the end of this list, emptying other. O(1)"""
+        if other is self or not other.head:
+            return
+        if self.head:
+            self.tail.next = other.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+    
+    def split_at(self, index: int) -> "LinkedList":
+        """
+        Cut the list before position index. O(index)
+        
+        Returns:
+            New list holding the nodes from index on; this list keeps
+            the first index nodes
+        """
+        rest = LinkedList()
+        if index <= 0:
+            rest.head, rest.tail, rest._size = self.head, self.tail, self._size
+            self.head = self.tail = None
+            self._size = 0
+            return rest
+        if index >= self._size:
+            return rest
+        
+        current = self.head
+        for _ in range(index - 1):
+            current = current.next
+        rest.head, rest.tail, rest._size = current.next, self.tail, self._size - index
+        current.next = None
+        self.tail = current
+        self._size = index
+        return rest
+    
     def search(self, data: Any) -> Optional[Node]:
         """Search for a node with given data. O(n)"""
         current = self.head
@@ -108,17 +237,13 @@ class LinkedList:
     
     def to_list(self) -> list:
         """Convert linked list to Python list."""
-        result = []
-        current = self.head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
+        return list(self)
     
     def reverse(self) -> None:
         """Reverse the linked list in place. O(n)"""
         prev = None
         current = self.head
+        self.tail = current
         
         while current:
             next_node = current.next
@@ -161,6 +286,86 @@ def test_linked_list():
     ll.reverse()
     assert ll.to_list() == [5, 4, 2]
     
+    # Test tail pointer survives delete / reverse
+    assert ll.tail.data == 2
+    ll.delete(2)  # Delete tail
+    ll.insert_at_tail(6)
+    assert ll.to_list() == [5, 4, 6]
+    ll.delete(5)
+    ll.delete(4)
+    ll.delete(6)
+    assert ll.is_empty() and ll.tail is None
+    ll.insert_at_tail(7)
+    assert ll.to_list() == [7] and ll.head is ll.tail
+    
+    # Test bulk construction and iteration
+    ll = LinkedList.from_iterable(range(5))
+    ll.extend([5, 6])
+    ll.extend([])
+    assert list(ll) == [0, 1, 2, 3, 4, 5, 6]
+    assert len(ll) == 7 and ll.tail.data == 6
+    empty = LinkedList()
+    empty.extend(iter([1, 2]))
+    assert empty.to_list() == [1, 2] and empty.tail.data == 2
+    assert not hasattr(Node(1), "__dict__")
+    
+    # Test bulk mutations against naive repeated delete() calls
+    import random
+    rng = random.Random(15)
+    values = [rng.randrange(300) for _ in range(3000)]
+    doomed = set(rng.sample(range(300), 100))
+    
+    naive = LinkedList.from_iterable(values)
+    for value in values:
+        if value in doomed:
+            naive.delete(value)
+    bulk = LinkedList.from_iterable(values)
+    assert bulk.remove_all(doomed) == 3000 - len(naive)
+    assert bulk.to_list() == naive.to_list() and len(bulk) == len(naive)
+    assert bulk.tail.data == naive.to_list()[-1]
+    
+    bulk = LinkedList.from_iterable(values)
+    assert bulk.dedupe() == len(values) - len(set(values))
+    assert bulk.to_list() == list(dict.fromkeys(values))
+    
+    odd = LinkedList.from_iterable(range(10))
+    assert odd.delete_where(lambda x: x % 2 == 0) == 5
+    assert odd.to_list() == [1, 3, 5, 7, 9] and len(odd) == 5
+    assert odd.delete_where(lambda x: x > 6) == 2 and odd.tail.data == 5
+    assert odd.delete_where(lambda x: True) == 3
+    assert odd.is_empty() and odd.tail is None
+    
+    # A predicate that raises midway leaves a consistent list behind
+    def explode_at_5(x):
+        if x == 5:
+            raise RuntimeError("boom")
+        return x < 2 or x == 3
+    
+    partial = LinkedList.from_iterable(range(8))
+    try:
+        partial.delete_where(explode_at_5)
+        assert False, "predicate error should propagate"
+    except RuntimeError:
+        pass
+    assert partial.to_list() == [2, 4, 5, 6, 7] and len(partial) == 5
+    assert partial.head.data == 2 and partial.tail.data == 7
+    partial.insert_at_tail(8)
+    assert partial.to_list() == [2, 4, 5, 6, 7, 8] and len(partial) == 6
+    
+    # Test splice / split_at
+    left = LinkedList.from_iterable([1, 2, 3])
+    right = LinkedList.from_iterable([4, 5])
+    left.splice(right)
+    assert left.to_list() == [1, 2, 3, 4, 5] and len(left) == 5
+    assert right.is_empty() and len(right) == 0
+    left.insert_at_tail(6)
+    rest = left.split_at(4)
+    assert left.to_list() == [1, 2, 3, 4] and len(left) == 4 and left.tail.data == 4
+    assert rest.to_list() == [5, 6] and len(rest) == 2 and rest.tail.data == 6
+    assert left.split_at(10).is_empty()
+    everything = left.split_at(0)
+    assert left.is_empty() and everything.to_list() == [1, 2, 3, 4]
+    
     print("✅ All linked list tests passed!")
 
 
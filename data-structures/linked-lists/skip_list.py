@@ -0,0 +1,261 @@
+"""
+Skip List Implementation
+========================
+
+A probabilistic ordered set built from linked lists: every key sits on
+the bottom level, and each node is promoted to the next level with
+probability p. Searches start on the sparse top level and drop down,
+skipping most of the list. The level generator is a seeded RNG, so runs
+are reproducible.
+
+Operations and Time Complexity (expected):
+    - Insert:           O(log n)
+    - Delete:           O(log n)
+    - Search:           O(log n)
+    - Floor / ceiling:  O(log n)
+    - Range iteration:  O(log n + k) for k yielded keys
+
+Space Complexity: O(n) expected (1 / (1 - p) pointers per key)
+"""
+
+import random
+from typing import Any, Iterator, List, Optional
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """A node in the skip list with one forward pointer per level."""
+
+    __slots__ = ("key", "forward")
+
+    def __init__(self, key: Any, level: int):
+        self.key = key
+        self.forward: List[Optional["SkipNode"]] = [None] * level
+
+    def __repr__(self):
+        return f"SkipNode({self.key})"
+
+
+class SkipList:
+    """Skip list ordered set."""
+
+    def __init__(self, seed: Optional[int] = None, p: float = 0.5,
+                 max_level: int = MAX_LEVEL):
+        self._rng = random.Random(seed)
+        self._p = p
+        self._max_level = max_level
+        self._head = SkipNode(None, max_level)
+        self._level = 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self._head.forward[0]
+        while node:
+            yield node.key
+            node = node.forward[0]
+
+    def __contains__(self, key: Any) -> bool:
+        return self.search(key) is not None
+
+    def __repr__(self) -> str:
+        return "SkipList(" + ", ".join(map(str, self)) + ")"
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self._max_level and self._rng.random() < self._p:
+            level += 1
+        return level
+
+    def _predecessors(self, key: Any) -> List[SkipNode]:
+        """Last node before key on every level."""
+        update = [self._head] * self._max_level
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.forward[lvl]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[lvl]
+            update[lvl] = node
+        return update
+
+    def _lower_node(self, key: Any) -> SkipNode:
+        """Last node with node.key < key (the head if there is none)."""
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.forward[lvl]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[lvl]
+        return node
+
+    def insert(self, key: Any) -> bool:
+        """Insert key. Returns False if it was already present."""
+        update = self._predecessors(key)
+        candidate = update[0].forward[0]
+        if candidate is not None and candidate.key == key:
+            return False
+
+        level = self._random_level()
+        if level > self._level:
+            self._level = level
+        node = SkipNode(key, level)
+        for lvl in range(level):
+            node.forward[lvl] = update[lvl].forward[lvl]
+            update[lvl].forward[lvl] = node
+        self._size += 1
+        return True
+
+    def delete(self, key: Any) -> bool:
+        """Delete key. Returns True if found."""
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return False
+
+        for lvl in range(len(node.forward)):
+            update[lvl].forward[lvl] = node.forward[lvl]
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def search(self, key: Any) -> Optional[SkipNode]:
+        """Search for the node holding key. O(log n) expected"""
+        node = self._lower_node(key).forward[0]
+        if node is not None and node.key == key:
+            return node
+        return None
+
+    def ceiling(self, key: Any) -> Optional[Any]:
+        """Smallest key >= key, None if there is none."""
+        node = self._lower_node(key).forward[0]
+        return None if node is None else node.key
+
+    def floor(self, key: Any) -> Optional[Any]:
+        """Largest key <= key, None if there is none."""
+        node = self._lower_node(key)
+        nxt = node.forward[0]
+        if nxt is not None and nxt.key == key:
+            return key
+        return None if node is self._head else node.key
+
+    def iter_range(self, lo: Any = None, hi: Any = None) -> Iterator[Any]:
+        """
+        Iterate keys with lo <= key <= hi in order.
+
+        Args:
+            lo: Lower bound, None for unbounded
+            hi: Upper bound, None for unbounded
+        """
+        node = self._head.forward[0] if lo is None else self._lower_node(lo).forward[0]
+        while node is not None and (hi is None or not hi < node.key):
+            yield node.key
+            node = node.forward[0]
+
+
+def benchmark_crossover(max_n: int = 4096, lookups: int = 2000) -> None:
+    """Time searches in SkipList vs LinkedList and report the crossover size."""
+    import time
+
+    from singly_linked_list import LinkedList
+
+    rng = random.Random(0)
+    crossover = None
+    print(f"{'n':>6} {'LinkedList':>12} {'SkipList':>12}  (us per search)")
+    n = 2
+    while n <= max_n:
+        keys = list(range(n))
+        ll = LinkedList.from_iterable(keys)
+        sl = SkipList(seed=1)
+        for key in keys:
+            sl.insert(key)
+        targets = [rng.randrange(n) for _ in range(lookups)]
+
+        start = time.perf_counter()
+        for t in targets:
+            ll.search(t)
+        ll_time = (time.perf_counter() - start) / lookups * 1e6
+
+        start = time.perf_counter()
+        for t in targets:
+            sl.search(t)
+        sl_time = (time.perf_counter() - start) / lookups * 1e6
+
+        print(f"{n:>6} {ll_time:>12.2f} {sl_time:>12.2f}")
+        if crossover is None and sl_time < ll_time:
+            crossover = n
+        n *= 2
+    print(f"SkipList is faster from n = {crossover}")
+
+
+def test_skip_list():
+    """Test cases for skip list."""
+    sl = SkipList(seed=42)
+    assert len(sl) == 0 and list(sl) == []
+    assert sl.floor(5) is None and sl.ceiling(5) is None
+
+    for key in [30, 10, 50, 20, 40]:
+        assert sl.insert(key) is True
+    assert sl.insert(20) is False
+    assert list(sl) == [10, 20, 30, 40, 50] and len(sl) == 5
+
+    assert sl.search(30).key == 30
+    assert sl.search(35) is None
+    assert 40 in sl and 45 not in sl
+
+    assert sl.floor(35) == 30 and sl.floor(30) == 30 and sl.floor(5) is None
+    assert sl.ceiling(35) == 40 and sl.ceiling(40) == 40 and sl.ceiling(55) is None
+    assert list(sl.iter_range(15, 40)) == [20, 30, 40]
+    assert list(sl.iter_range(hi=20)) == [10, 20]
+    assert list(sl.iter_range(lo=45)) == [50]
+
+    assert sl.delete(30) is True
+    assert sl.delete(30) is False
+    assert list(sl) == [10, 20, 40, 50]
+
+    # Same seed -> same structure
+    a, b = SkipList(seed=7), SkipList(seed=7)
+    for key in range(200):
+        a.insert(key)
+        b.insert(key)
+
+    def levels(s):
+        node, result = s._head.forward[0], []
+        while node:
+            result.append(len(node.forward))
+            node = node.forward[0]
+        return result
+
+    assert levels(a) == levels(b)
+
+    # Randomised comparison against a Python set
+    rng = random.Random(3)
+    sl = SkipList(seed=3)
+    ref = set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if rng.random() < 0.6:
+            assert sl.insert(key) == (key not in ref)
+            ref.add(key)
+        else:
+            assert sl.delete(key) == (key in ref)
+            ref.discard(key)
+    assert list(sl) == sorted(ref) and len(sl) == len(ref)
+
+    print("✅ All skip list tests passed!")
+
+
+if __name__ == "__main__":
+    test_skip_list()
+
+    # Example usage and crossover benchmark against the plain linked list
+    sl = SkipList(seed=0)
+    for key in [5, 1, 9, 3, 7]:
+        sl.insert(key)
+    print(f"Skip list: {sl}")
+    print(f"floor(6) = {sl.floor(6)}, ceiling(6) = {sl.ceiling(6)}")
+    benchmark_crossover()
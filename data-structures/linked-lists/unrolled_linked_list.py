@@ -0,0 +1,362 @@
+"""
+Unrolled Linked List Implementation
+===================================
+
+A linked list whose nodes each hold a block of up to ``capacity``
+elements in a Python list. Traversal follows one pointer per block
+instead of one per element, and bulk operations (iteration, to_list)
+copy whole blocks at C speed.
+
+Blocks split in half when an insert overflows them, and a block that
+falls below half full after a delete borrows from or merges with its
+successor, so every block except the last stays at least half full.
+
+Operations and Time Complexity (B = capacity):
+    - Insert at head / tail:  O(B)
+    - Insert / delete at i:   O(n/B + B)
+    - Access by index:        O(n/B)
+    - Search:                 O(n)
+    - Iteration / to_list:    O(n), one pointer hop per block
+
+Space Complexity: O(n)
+"""
+
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional
+
+DEFAULT_CAPACITY = 64
+
+
+class Block:
+    """A node holding up to `capacity` consecutive elements."""
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: Optional[List[Any]] = None):
+        self.items: List[Any] = items if items is not None else []
+        self.next: Optional["Block"] = None
+
+    def __repr__(self):
+        return f"Block({self.items})"
+
+
+class UnrolledLinkedList:
+    """Linked list of fixed-capacity element blocks."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head: Optional[Block] = None
+        self.tail: Optional[Block] = None
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any],
+                      capacity: int = DEFAULT_CAPACITY) -> "UnrolledLinkedList":
+        """Build a list from any iterable in one pass. O(n)"""
+        ull = cls(capacity)
+        ull.extend(iterable)
+        return ull
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._blocks_items())
+
+    def __repr__(self) -> str:
+        if not self.head:
+            return "UnrolledLinkedList(empty)"
+        return "UnrolledLinkedList(" + " -> ".join(map(str, self)) + ")"
+
+    def _blocks_items(self) -> Iterator[List[Any]]:
+        block = self.head
+        while block:
+            yield block.items
+            block = block.next
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty."""
+        return self._size == 0
+
+    def _find(self, index: int):
+        """Return (block before, block, offset) holding position index."""
+        prev, block = None, self.head
+        while index >= len(block.items):
+            index -= len(block.items)
+            prev, block = block, block.next
+        return prev, block, index
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        return index
+
+    def _split(self, block: Block) -> None:
+        """Move the upper half of an overfull block into a new successor."""
+        half = len(block.items) // 2
+        new_block = Block(block.items[half:])
+        del block.items[half:]
+        new_block.next = block.next
+        block.next = new_block
+        if block is self.tail:
+            self.tail = new_block
+
+    def _rebalance(self, prev: Optional[Block], block: Block) -> None:
+        """Restore the half-full invariant after a delete from block."""
+        if block.items and len(block.items) >= self.capacity // 2:
+            return
+        following = block.next
+        if following is not None:
+            if len(block.items) + len(following.items) <= self.capacity:
+                block.items.extend(following.items)
+                block.next = following.next
+                if following is self.tail:
+                    self.tail = block
+            else:
+                take = (len(following.items) - len(block.items)) // 2
+                block.items.extend(following.items[:take])
+                del following.items[:take]
+        if not block.items:
+            # Only possible for the last remaining block of a list
+            if prev is None:
+                self.head = block.next
+            else:
+                prev.next = block.next
+            if block is self.tail:
+                self.tail = prev
+
+    def insert(self, index: int, data: Any) -> None:
+        """Insert data before position index. O(n/B + B)"""
+        if index < 0:
+            index = max(0, index + self._size)
+        if index >= self._size:
+            self.insert_at_tail(data)
+            return
+        _, block, offset = self._find(index)
+        block.items.insert(offset, data)
+        self._size += 1
+        if len(block.items) > self.capacity:
+            self._split(block)
+
+    def insert_at_head(self, data: Any) -> None:
+        """Insert data at the beginning. O(B)"""
+        if self.head is None:
+            self.insert_at_tail(data)
+            return
+        self.head.items.insert(0, data)
+        self._size += 1
+        if len(self.head.items) > self.capacity:
+            self._split(self.head)
+
+    def insert_at_tail(self, data: Any) -> None:
+        """Insert data at the end. O(1) amortized"""
+        if self.tail is None:
+            self.head = self.tail = Block()
+        elif len(self.tail.items) >= self.capacity:
+            # Start a fresh block; full blocks stay full for sequential appends
+            self.tail.next = Block()
+            self.tail = self.tail.next
+        self.tail.items.append(data)
+        self._size += 1
+
+    append = insert_at_tail
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of iterable at the end, filling whole blocks."""
+        items = list(iterable)
+        if not items:
+            return
+        cap = self.capacity
+        start = 0
+        if self.tail is not None:
+            start = cap - len(self.tail.items)
+            self.tail.items.extend(items[:start])
+        for i in range(max(start, 0), len(items), cap):
+            block = Block(items[i:i + cap])
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        self._size += len(items)
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the element at position index. O(n/B)"""
+        _, block, offset = self._find(self._normalize(index))
+        return block.items[offset]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        _, block, offset = self._find(self._normalize(index))
+        block.items[offset] = data
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the element at position index."""
+        prev, block, offset = self._find(self._normalize(index))
+        data = block.items.pop(offset)
+        self._size -= 1
+        self._rebalance(prev, block)
+        return data
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def delete(self, data: Any) -> bool:
+        """Delete first occurrence of data. Returns True if found."""
+        prev, block = None, self.head
+        while block:
+            items = block.items
+            if data in items:
+                items.remove(data)
+                self._size -= 1
+                self._rebalance(prev, block)
+                return True
+            prev, block = block, block.next
+        return False
+
+    def search(self, data: Any) -> int:
+        """Position of the first occurrence of data, -1 if not found. O(n)"""
+        base = 0
+        for items in self._blocks_items():
+            if data in items:
+                return base + items.index(data)
+            base += len(items)
+        return -1
+
+    def to_list(self) -> list:
+        """Convert to a Python list, copying whole blocks at once."""
+        result = []
+        for items in self._blocks_items():
+            result.extend(items)
+        return result
+
+    def reverse(self) -> None:
+        """
+        Reverse the list in place. O(n)
+
+        Elements are rewritten into the existing blocks, which keep their
+        sizes and order. Reversing the block chain instead would move the
+        (possibly short) last block to the front and break the invariant.
+        """
+        values = self.to_list()
+        values.reverse()
+        pos = 0
+        for items in self._blocks_items():
+            k = len(items)
+            items[:] = values[pos:pos + k]
+            pos += k
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    """Compare traversal speed with the Node-based LinkedList."""
+    import time
+
+    from singly_linked_list import LinkedList
+
+    ll = LinkedList.from_iterable(range(n))
+    print(f"Traversing {n:,} elements")
+    for capacity in (16, 64, 256):
+        ull = UnrolledLinkedList.from_iterable(range(n), capacity)
+        for label, base_fn, fn in (
+            ("iterate", lambda: sum(1 for _ in ll), lambda: sum(1 for _ in ull)),
+            ("to_list", ll.to_list, ull.to_list),
+            ("search (miss)", lambda: ll.search(-1), lambda: ull.search(-1)),
+        ):
+            start = time.perf_counter()
+            base_fn()
+            base = time.perf_counter() - start
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"  B={capacity:<4} {label:>14}: LinkedList {base:.3f}s | "
+                  f"unrolled {elapsed:.3f}s ({base / elapsed:.1f}x)")
+
+
+def test_unrolled_linked_list():
+    """Test cases for unrolled linked list."""
+    import random
+
+    ull = UnrolledLinkedList(capacity=4)
+    assert ull.is_empty() and len(ull) == 0 and ull.to_list() == []
+
+    ull.insert_at_head(3)
+    ull.insert_at_head(2)
+    ull.insert_at_head(1)
+    ull.insert_at_tail(4)
+    ull.insert_at_tail(5)
+    assert ull.to_list() == [1, 2, 3, 4, 5]
+    assert ull[0] == 1 and ull[-1] == 5 and ull[3] == 4
+
+    assert ull.search(3) == 2 and ull.search(10) == -1
+    assert ull.delete(3) is True and ull.delete(10) is False
+    assert ull.to_list() == [1, 2, 4, 5]
+
+    def check(ull):
+        """Every block but the last is at least half full; tail is last."""
+        block = ull.head
+        while block and block.next:
+            assert ull.capacity // 2 <= len(block.items) <= ull.capacity
+            block = block.next
+        assert ull.tail is block
+
+    ull.reverse()
+    assert ull.to_list() == [5, 4, 2, 1]
+    ull.insert_at_tail(0)
+    assert list(ull) == [5, 4, 2, 1, 0]
+
+    # A short last block must not end up at the front
+    ull = UnrolledLinkedList.from_iterable(range(9), capacity=4)  # 4, 4, 1
+    ull.reverse()
+    assert ull.to_list() == list(range(8, -1, -1))
+    check(ull)
+    assert [len(items) for items in ull._blocks_items()] == [4, 4, 1]
+
+    # Randomised comparison against a Python list, small blocks
+    rng = random.Random(4)
+    ull = UnrolledLinkedList.from_iterable(range(50), capacity=4)
+    ref = list(range(50))
+    for _ in range(3000):
+        op = rng.random()
+        if op < 0.4 or not ref:
+            i = rng.randint(0, len(ref))
+            value = rng.randrange(100)
+            ull.insert(i, value)
+            ref.insert(i, value)
+        elif op < 0.7:
+            i = rng.randrange(len(ref))
+            assert ull.pop(i) == ref.pop(i)
+        elif op < 0.73:
+            ull.reverse()
+            ref.reverse()
+        elif op < 0.85:
+            value = rng.randrange(100)
+            assert ull.delete(value) == (value in ref)
+            if value in ref:
+                ref.remove(value)
+        else:
+            i = rng.randrange(len(ref))
+            ull[i] = -i
+            ref[i] = -i
+        assert len(ull) == len(ref)
+        check(ull)
+    assert ull.to_list() == ref
+
+    ull.extend(range(7))
+    assert ull.to_list() == ref + list(range(7))
+    while len(ull):
+        ull.pop(0)
+    assert ull.head is None and ull.tail is None
+
+    print("✅ All unrolled linked list tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_unrolled_linked_list()
+
+    # Benchmark: python unrolled_linked_list.py [n]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
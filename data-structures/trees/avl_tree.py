@@ -0,0 +1,384 @@
+"""
+AVL Tree (Balanced Ordered Map) Implementation
+==============================================
+
+A self-balancing binary search tree mapping keys to values. Every node
+keeps its height (to rebalance with rotations) and its subtree size (for
+order statistics), so the tree never degenerates into a linked list on
+sorted input.
+
+Operations and Time Complexity:
+    - Insert / update:       O(log n)
+    - Delete:                O(log n)
+    - Lookup:                O(log n)
+    - Rank / select:         O(log n)
+    - Range items(lo, hi):   O(log n + k) for k yielded items
+    - Min / max:             O(log n)
+
+Space Complexity: O(n)
+"""
+
+from typing import Any, Iterator, Optional, Tuple
+
+_MISSING = object()
+
+
+class AVLNode:
+    """A tree node with height and subtree size bookkeeping."""
+
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key: Any, value: Any):
+        self.key = key
+        self.value = value
+        self.left: Optional["AVLNode"] = None
+        self.right: Optional["AVLNode"] = None
+        self.height = 1
+        self.size = 1
+
+    def __repr__(self):
+        return f"AVLNode({self.key!r}: {self.value!r})"
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node else 0
+
+
+def _size(node: Optional[AVLNode]) -> int:
+    return node.size if node else 0
+
+
+def _update(node: AVLNode) -> None:
+    left, right = node.left, node.right
+    node.height = 1 + max(left.height if left else 0, right.height if right else 0)
+    node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+def _rotate_right(node: AVLNode) -> AVLNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: AVLNode) -> AVLNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree:
+    """Balanced ordered map with order statistics and range queries."""
+
+    def __init__(self):
+        self.root: Optional[AVLNode] = None
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, _ in self.items():
+            yield key
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return "AVLTree({" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "})"
+
+    def _find(self, key: Any) -> Optional[AVLNode]:
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for key, or default if absent."""
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        """Insert key, or replace its value if it already exists."""
+        self.root = self._insert(self.root, key, value)
+
+    def _insert(self, node: Optional[AVLNode], key: Any, value: Any) -> AVLNode:
+        if node is None:
+            return AVLNode(key, value)
+        if key < node.key:
+            node.left = self._insert(node.left, key, value)
+        elif node.key < key:
+            node.right = self._insert(node.right, key, value)
+        else:
+            node.value = value
+            return node
+        return _rebalance(node)
+
+    def delete(self, key: Any) -> bool:
+        """Delete key. Returns True if found."""
+        before = len(self)
+        self.root = self._delete(self.root, key)
+        return len(self) < before
+
+    def _delete(self, node: Optional[AVLNode], key: Any) -> Optional[AVLNode]:
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        elif node.key < key:
+            node.right = self._delete(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Replace with the in-order successor, then remove it below
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node.right = self._delete(node.right, successor.key)
+        return _rebalance(node)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Remove key and return its value."""
+        node = self._find(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.value
+        self.delete(key)
+        return value
+
+    def min(self) -> Any:
+        """Smallest key; ValueError if empty."""
+        node = self.root
+        if node is None:
+            raise ValueError("min() of empty AVLTree")
+        while node.left:
+            node = node.left
+        return node.key
+
+    def max(self) -> Any:
+        """Largest key; ValueError if empty."""
+        node = self.root
+        if node is None:
+            raise ValueError("max() of empty AVLTree")
+        while node.right:
+            node = node.right
+        return node.key
+
+    def rank(self, key: Any) -> int:
+        """Number of keys strictly less than key."""
+        node = self.root
+        rank = 0
+        while node:
+            if node.key < key:
+                rank += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def select(self, index: int) -> Tuple[Any, Any]:
+        """Return the (key, value) pair at sorted position index."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("AVLTree index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index > left:
+                index -= left + 1
+                node = node.right
+            else:
+                return node.key, node.value
+
+    def items(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Iterate (key, value) pairs with lo <= key < hi in order.
+
+        Args:
+            lo: Inclusive lower bound, None for unbounded
+            hi: Exclusive upper bound, None for unbounded
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                # Skip left subtrees that lie entirely below lo
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key, node.value
+            node = node.right
+
+
+def benchmark(n: int = 100_000, ops: int = 100_000) -> None:
+    """Mixed read/write workload against a sorted list + bisect."""
+    import random
+    import time
+    from bisect import bisect_left, insort
+
+    rng = random.Random(0)
+    initial = rng.sample(range(n * 10), n)
+    workload = [(rng.random(), rng.randrange(n * 10)) for _ in range(ops)]
+
+    tree = AVLTree()
+    for key in initial:
+        tree[key] = key
+    keys = sorted(initial)
+
+    def run_tree():
+        for r, key in workload:
+            if r < 0.5:
+                tree.get(key)
+            elif r < 0.75:
+                tree[key] = key
+            else:
+                tree.delete(key)
+
+    def run_sorted_list():
+        for r, key in workload:
+            i = bisect_left(keys, key)
+            present = i < len(keys) and keys[i] == key
+            if r < 0.5:
+                pass
+            elif r < 0.75:
+                if not present:
+                    insort(keys, key)
+            elif present:
+                del keys[i]
+
+    print(f"n={n:,}, {ops:,} ops (50% get / 25% insert / 25% delete)")
+    for name, fn in (("AVLTree", run_tree), ("sorted list + bisect", run_sorted_list)):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {name:>20}: {ops / elapsed:>12,.0f} ops/sec")
+
+
+def test_avl_tree():
+    """Test cases for the AVL tree."""
+    import random
+
+    tree = AVLTree()
+    assert len(tree) == 0 and list(tree) == []
+
+    # Sorted input must stay balanced
+    for i in range(1024):
+        tree[i] = i * i
+    assert tree.root.height <= 11
+    assert tree[12] == 144 and 1023 in tree and 1024 not in tree
+    assert tree.min() == 0 and tree.max() == 1023
+
+    tree[5] = "five"
+    assert tree.get(5) == "five" and len(tree) == 1024
+    assert tree.rank(100) == 100 and tree.rank(-5) == 0 and tree.rank(5000) == 1024
+    assert tree.select(0) == (0, 0) and tree.select(-1) == (1023, 1023 ** 2)
+    assert [k for k, _ in tree.items(10, 14)] == [10, 11, 12, 13]
+    assert [k for k, _ in tree.items(hi=3)] == [0, 1, 2]
+    assert [k for k, _ in tree.items(lo=1021)] == [1021, 1022, 1023]
+
+    assert tree.pop(5) == "five" and 5 not in tree
+    assert tree.pop(5, None) is None
+    try:
+        del tree[5]
+        assert False, "missing key should raise"
+    except KeyError:
+        pass
+
+    # Randomised comparison against a dict
+    rng = random.Random(17)
+    tree, ref = AVLTree(), {}
+    for _ in range(5000):
+        key = rng.randrange(1000)
+        if rng.random() < 0.6:
+            tree[key] = -key
+            ref[key] = -key
+        else:
+            assert tree.delete(key) == (key in ref)
+            ref.pop(key, None)
+    keys = sorted(ref)
+    assert list(tree) == keys and len(tree) == len(keys)
+    for i in range(0, len(keys), 37):
+        assert tree.select(i) == (keys[i], -keys[i])
+        assert tree.rank(keys[i]) == i
+    assert [k for k, _ in tree.items(200, 400)] == [k for k in keys if 200 <= k < 400]
+
+    def check(node):
+        if node is None:
+            return 0
+        lh, rh = check(node.left), check(node.right)
+        assert abs(lh - rh) <= 1 and node.height == 1 + max(lh, rh)
+        assert node.size == 1 + _size(node.left) + _size(node.right)
+        return node.height
+
+    check(tree.root)
+
+    print("✅ All AVL tree tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_avl_tree()
+
+    # Example usage
+    tree = AVLTree()
+    for key in [50, 20, 70, 10, 30, 60, 80]:
+        tree[key] = str(key)
+    print(f"Tree: {tree}")
+    print(f"rank(60) = {tree.rank(60)}, select(2) = {tree.select(2)}")
+    print(f"items(20, 61) = {list(tree.items(20, 61))}")
+
+    # Benchmark: python avl_tree.py [n]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    benchmark(n)
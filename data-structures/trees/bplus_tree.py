@@ -0,0 +1,559 @@
+"""
+On-Disk B+ Tree Implementation
+==============================
+
+A persistent, page-based B+ tree mapping int64 keys to int64 values in a
+single file. Internal pages hold separator keys and child page numbers,
+leaf pages hold the key/value pairs. Decoded pages are kept in an LRU
+page cache so hot paths never touch the disk.
+
+Crash safety comes from copy-on-write (shadow paging): a committed page
+is never modified in place. Changes copy the pages on the root-to-leaf
+path into fresh pages, and ``commit()`` writes them out, fsyncs, and
+only then flips to the new root by writing one of two alternating meta
+pages (generation number + CRC32). After a crash the newest meta page
+with a valid checksum still points at a complete, consistent tree.
+
+Single writer only. Deletes do not merge underfull pages, and pages
+freed by copy-on-write are reused within a session but not tracked
+across restarts.
+
+File layout (PAGE_SIZE pages):
+    page 0, 1   meta slots
+    page 2..    leaf / internal pages
+
+Operations and Time Complexity (B = keys per page):
+    - Lookup:       O(log_B n) page reads
+    - Insert:       O(log_B n) page reads, O(log_B n) page copies
+    - Delete:       O(log_B n)
+    - Range scan:   O(log_B n + k / B) page reads for k results
+    - Bulk load:    O(n) sequential writes
+
+Space Complexity: O(n / B) pages on disk, cache_pages pages in memory
+"""
+
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PAGE_SIZE = 4096
+PAGE_HEADER = struct.Struct("<BxHxxxx")            # kind, count
+META = struct.Struct("<4sQQQQ")                    # magic, generation, root, pages, keys
+MAGIC = b"BPT1"
+LEAF, INTERNAL = 1, 2
+NO_PAGE = 0                                        # page 0 is a meta page, never a node
+FIRST_DATA_PAGE = 2
+
+LEAF_MAX = (PAGE_SIZE - PAGE_HEADER.size) // 16               # 255 key/value pairs
+INTERNAL_MAX = (PAGE_SIZE - PAGE_HEADER.size - 8) // 16        # 254 keys, 255 children
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _check_int64(key: int, value: int) -> None:
+    """Reject anything a page cannot encode, before it reaches the dirty set."""
+    for name, x in (("key", key), ("value", value)):
+        if not isinstance(x, int) or not INT64_MIN <= x <= INT64_MAX:
+            raise ValueError(f"{name} must be an int64, got {x!r}")
+
+
+class _Page:
+    """Decoded page: sorted keys plus values (leaf) or child page numbers."""
+
+    __slots__ = ("kind", "keys", "items")
+
+    def __init__(self, kind: int, keys: List[int], items: List[int]):
+        self.kind = kind
+        self.keys = keys
+        self.items = items
+
+    def encode(self) -> bytes:
+        body = PAGE_HEADER.pack(self.kind, len(self.keys))
+        body += array("q", self.keys).tobytes() + array("q", self.items).tobytes()
+        return body.ljust(PAGE_SIZE, b"\0")
+
+    @classmethod
+    def decode(cls, data: bytes) -> "_Page":
+        kind, count = PAGE_HEADER.unpack_from(data)
+        n_items = count if kind == LEAF else count + 1
+        keys = array("q")
+        keys.frombytes(data[PAGE_HEADER.size:PAGE_HEADER.size + 8 * count])
+        items = array("q")
+        start = PAGE_HEADER.size + 8 * count
+        items.frombytes(data[start:start + 8 * n_items])
+        return cls(kind, keys.tolist(), items.tolist())
+
+
+class BPlusTree:
+    """Single-file, copy-on-write B+ tree of int64 -> int64."""
+
+    def __init__(self, path: str, cache_pages: int = 1024, sync: bool = True):
+        self.path = path
+        self.cache_pages = cache_pages
+        self.sync = sync
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        self._cache: "OrderedDict[int, _Page]" = OrderedDict()
+        self._dirty: Dict[int, _Page] = {}
+        self._free: List[int] = []         # reusable now
+        self._pending_free: List[int] = [] # reusable after the next commit
+
+        if exists:
+            self._load_meta()
+        else:
+            self._generation = 0
+            self._root = NO_PAGE
+            self._page_count = FIRST_DATA_PAGE
+            self._len = 0
+            self._write_meta()
+        self._committed = (self._root, self._page_count, self._len)
+
+    # ------------------------------------------------------------------
+    # Meta pages
+    # ------------------------------------------------------------------
+
+    def _write_meta(self) -> None:
+        self._generation += 1
+        body = META.pack(MAGIC, self._generation, self._root, self._page_count, self._len)
+        body += struct.pack("<I", zlib.crc32(body))
+        self._file.seek((self._generation % 2) * PAGE_SIZE)
+        self._file.write(body.ljust(PAGE_SIZE, b"\0"))
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def _load_meta(self) -> None:
+        best = None
+        for slot in (0, 1):
+            self._file.seek(slot * PAGE_SIZE)
+            data = self._file.read(META.size + 4)
+            if len(data) < META.size + 4:
+                continue
+            (crc,) = struct.unpack_from("<I", data, META.size)
+            if zlib.crc32(data[:META.size]) != crc:
+                continue
+            magic, generation, root, pages, keys = META.unpack_from(data)
+            if magic == MAGIC and (best is None or generation > best[0]):
+                best = (generation, root, pages, keys)
+        if best is None:
+            raise ValueError(f"{self.path} has no valid B+ tree meta page")
+        self._generation, self._root, self._page_count, self._len = best
+
+    # ------------------------------------------------------------------
+    # Page access
+    # ------------------------------------------------------------------
+
+    def _read(self, page_no: int) -> _Page:
+        page = self._dirty.get(page_no)
+        if page is not None:
+            return page
+        page = self._cache.get(page_no)
+        if page is not None:
+            self._cache.move_to_end(page_no)
+            return page
+        self._file.seek(page_no * PAGE_SIZE)
+        page = _Page.decode(self._file.read(PAGE_SIZE))
+        self._cache[page_no] = page
+        if len(self._cache) > self.cache_pages:
+            self._cache.popitem(last=False)
+        return page
+
+    def _allocate(self, page: _Page) -> int:
+        """Give a new in-memory page a page number and mark it dirty."""
+        if self._free:
+            page_no = self._free.pop()
+        else:
+            page_no = self._page_count
+            self._page_count += 1
+        self._dirty[page_no] = page
+        return page_no
+
+    def _writable(self, page_no: int) -> Tuple[int, _Page]:
+        """Copy-on-write: pages from earlier commits are never modified in place."""
+        page = self._dirty.get(page_no)
+        if page is not None:
+            return page_no, page
+        original = self._read(page_no)
+        self._pending_free.append(page_no)
+        page = _Page(original.kind, list(original.keys), list(original.items))
+        return self._allocate(page), page
+
+    def commit(self) -> None:
+        """Write dirty pages, fsync, then atomically switch the meta page."""
+        if not self._dirty and self._committed == (self._root, self._page_count, self._len):
+            return
+        for page_no in sorted(self._dirty):
+            self._file.seek(page_no * PAGE_SIZE)
+            self._file.write(self._dirty[page_no].encode())
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._write_meta()
+
+        for page_no, page in self._dirty.items():
+            self._cache[page_no] = page
+        while len(self._cache) > self.cache_pages:
+            self._cache.popitem(last=False)
+        self._dirty.clear()
+        for page_no in self._pending_free:
+            self._cache.pop(page_no, None)
+        self._free.extend(self._pending_free)
+        self._pending_free.clear()
+        self._committed = (self._root, self._page_count, self._len)
+
+    def close(self) -> None:
+        """Commit pending changes and close the file."""
+        if not self._file.closed:
+            self.commit()
+            self._file.close()
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _find_leaf(self, key: int) -> Optional[_Page]:
+        if self._root == NO_PAGE:
+            return None
+        page = self._read(self._root)
+        while page.kind == INTERNAL:
+            page = self._read(page.items[bisect_right(page.keys, key)])
+        return page
+
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        """Return the value for key, or default if absent."""
+        leaf = self._find_leaf(key)
+        if leaf is not None:
+            i = bisect_left(leaf.keys, key)
+            if i < len(leaf.keys) and leaf.keys[i] == key:
+                return leaf.items[i]
+        return default
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: int) -> int:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def range(self, lo: Optional[int] = None,
+              hi: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate (key, value) pairs with lo <= key < hi in key order.
+
+        Copy-on-write pages have no sibling links, so the scan keeps the
+        root-to-leaf path on a stack instead.
+        """
+        if self._root == NO_PAGE:
+            return
+        stack = [self._root]
+        while stack:
+            page = self._read(stack.pop())
+            if page.kind == LEAF:
+                i = 0 if lo is None else bisect_left(page.keys, lo)
+                keys, values = page.keys, page.items
+                for j in range(i, len(keys)):
+                    if hi is not None and keys[j] >= hi:
+                        return
+                    yield keys[j], values[j]
+                continue
+            first = 0 if lo is None else bisect_right(page.keys, lo)
+            if hi is None:
+                last = len(page.items) - 1
+            else:
+                last = bisect_left(page.keys, hi)
+            stack.extend(reversed(page.items[first:last + 1]))
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        return self.range()
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def put(self, key: int, value: int) -> None:
+        """Insert or update key (visible now, durable after commit())."""
+        _check_int64(key, value)
+        if self._root == NO_PAGE:
+            self._root = self._allocate(_Page(LEAF, [key], [value]))
+            self._len = 1
+            return
+        root, split = self._insert(self._root, key, value)
+        if split is not None:
+            sep, right = split
+            root = self._allocate(_Page(INTERNAL, [sep], [root, right]))
+        self._root = root
+
+    __setitem__ = put
+
+    def _insert(self, page_no: int, key: int, value: int):
+        page_no, page = self._writable(page_no)
+        keys, items = page.keys, page.items
+
+        if page.kind == LEAF:
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                items[i] = value
+                return page_no, None
+            keys.insert(i, key)
+            items.insert(i, value)
+            self._len += 1
+            if len(keys) <= LEAF_MAX:
+                return page_no, None
+            mid = len(keys) // 2
+            right = _Page(LEAF, keys[mid:], items[mid:])
+            del keys[mid:], items[mid:]
+            return page_no, (right.keys[0], self._allocate(right))
+
+        i = bisect_right(keys, key)
+        child, split = self._insert(items[i], key, value)
+        items[i] = child
+        if split is None:
+            return page_no, None
+        sep, right_no = split
+        keys.insert(i, sep)
+        items.insert(i + 1, right_no)
+        if len(keys) <= INTERNAL_MAX:
+            return page_no, None
+        mid = len(keys) // 2
+        sep = keys[mid]
+        right = _Page(INTERNAL, keys[mid + 1:], items[mid + 1:])
+        del keys[mid:], items[mid + 1:]
+        return page_no, (sep, self._allocate(right))
+
+    def delete(self, key: int) -> bool:
+        """Delete key. Returns True if found (durable after commit())."""
+        if key not in self:
+            return False
+        # Copy the whole path, then remove from the leaf
+        page_no, page = self._writable(self._root)
+        self._root = page_no
+        while page.kind == INTERNAL:
+            i = bisect_right(page.keys, key)
+            child_no, child = self._writable(page.items[i])
+            page.items[i] = child_no
+            page = child
+        i = bisect_left(page.keys, key)
+        del page.keys[i], page.items[i]
+        self._len -= 1
+        return True
+
+    def bulk_load(self, items: Iterable[Tuple[int, int]], fill: float = 1.0) -> None:
+        """
+        Build the tree bottom-up from (key, value) pairs in strictly
+        increasing key order. Pages are written sequentially. The tree
+        must be empty; the result is committed. On invalid input the tree
+        is left empty (pages already written are unreferenced).
+
+        fill (0 < fill <= 1) is the fraction of each page to use, leaving
+        room for later inserts without splits.
+        """
+        if self._root != NO_PAGE:
+            raise ValueError("bulk_load requires an empty tree")
+        if not 0 < fill <= 1:   # Also rejects NaN
+            raise ValueError(f"fill must be in (0, 1], got {fill!r}")
+        leaf_cap = max(2, int(LEAF_MAX * fill))
+        internal_cap = max(2, int(INTERNAL_MAX * fill))
+
+        # Tree state is only assigned once all input has been validated
+        page_count = self._page_count
+        count = 0
+
+        def write(page: _Page) -> int:
+            nonlocal page_count
+            page_no = page_count
+            page_count += 1
+            self._file.seek(page_no * PAGE_SIZE)
+            self._file.write(page.encode())
+            return page_no
+
+        level: List[Tuple[int, int]] = []  # (first key, page number)
+        keys: List[int] = []
+        values: List[int] = []
+        previous = None
+        for key, value in items:
+            _check_int64(key, value)
+            if previous is not None and key <= previous:
+                raise ValueError("bulk_load input must be strictly increasing")
+            previous = key
+            keys.append(key)
+            values.append(value)
+            count += 1
+            if len(keys) == leaf_cap:
+                level.append((keys[0], write(_Page(LEAF, keys, values))))
+                keys, values = [], []
+        if keys:
+            level.append((keys[0], write(_Page(LEAF, keys, values))))
+
+        while len(level) > 1:
+            parents = []
+            for start in range(0, len(level), internal_cap + 1):
+                group = level[start:start + internal_cap + 1]
+                page = _Page(INTERNAL, [k for k, _ in group[1:]], [p for _, p in group])
+                parents.append((group[0][0], write(page)))
+            level = parents
+
+        self._page_count = page_count
+        self._len = count
+        if level:
+            self._root = level[0][1]
+        self._file.flush()
+        self.commit()
+
+
+def benchmark(n: int = 200_000, lookups: int = 200_000) -> None:
+    """Point lookups/sec against an in-memory dict."""
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(0)
+    keys = [rng.randrange(n * 10) for _ in range(lookups)]
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "bench.bpt")
+        start = time.perf_counter()
+        with BPlusTree(path) as tree:
+            tree.bulk_load((k, k) for k in range(0, n * 10, 10))
+        print(f"bulk_load {n:,} keys: {time.perf_counter() - start:.2f}s, "
+              f"{os.path.getsize(path) / 1e6:.1f} MB")
+
+        reference = {k: k for k in range(0, n * 10, 10)}
+        for label, cache in (("cold-ish cache (64 pages)", 64), ("warm cache", 1 << 20)):
+            with BPlusTree(path, cache_pages=cache) as tree:
+                start = time.perf_counter()
+                for k in keys:
+                    tree.get(k)
+                elapsed = time.perf_counter() - start
+            print(f"  BPlusTree, {label:>26}: {lookups / elapsed:>12,.0f} lookups/sec")
+
+        start = time.perf_counter()
+        for k in keys:
+            reference.get(k)
+        elapsed = time.perf_counter() - start
+        print(f"  {'dict':>38}: {lookups / elapsed:>12,.0f} lookups/sec")
+
+
+def test_bplus_tree():
+    """Test cases for the on-disk B+ tree."""
+    import random
+    import tempfile
+
+    rng = random.Random(20)
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "tree.bpt")
+
+        # Random inserts / updates / deletes with a tiny cache
+        ref = {}
+        with BPlusTree(path, cache_pages=8, sync=False) as tree:
+            assert len(tree) == 0 and tree.get(1) is None and list(tree.range()) == []
+            for step in range(20000):
+                key = rng.randrange(-5000, 5000)
+                if rng.random() < 0.75:
+                    tree[key] = step
+                    ref[key] = step
+                else:
+                    assert tree.delete(key) == (key in ref)
+                    ref.pop(key, None)
+                if step % 5000 == 0:
+                    tree.commit()
+            assert len(tree) == len(ref)
+
+        # Survives reopening
+        with BPlusTree(path, sync=False) as tree:
+            assert len(tree) == len(ref)
+            assert list(tree.items()) == sorted(ref.items())
+            for key in rng.sample(sorted(ref), 200):
+                assert tree[key] == ref[key]
+            expected = [(k, v) for k, v in sorted(ref.items()) if -1000 <= k < 1234]
+            assert list(tree.range(-1000, 1234)) == expected
+            assert list(tree.range(hi=-4990)) == [(k, v) for k, v in sorted(ref.items()) if k < -4990]
+
+            # Uncommitted changes are lost on a crash (file closed without commit)
+            tree.put(10**9, 1)
+            tree._file.close()
+
+        with BPlusTree(path, sync=False) as tree:
+            assert 10**9 not in tree and len(tree) == len(ref)
+
+        # A torn meta write falls back to the previous generation
+        with BPlusTree(path, sync=False) as tree:
+            generation = tree._generation
+            tree.put(10**9, 1)
+        with open(path, "r+b") as f:
+            f.seek(((generation + 1) % 2) * PAGE_SIZE + 12)
+            f.write(b"\xff\xff")
+        with BPlusTree(path, sync=False) as tree:
+            assert 10**9 not in tree and len(tree) == len(ref)
+
+        # Bulk load
+        bulk_path = os.path.join(d, "bulk.bpt")
+        with BPlusTree(bulk_path, sync=False) as tree:
+            tree.bulk_load((k, -k) for k in range(0, 200_000, 2))
+        with BPlusTree(bulk_path, sync=False) as tree:
+            assert len(tree) == 100_000
+            assert tree[199_998] == -199_998 and 3 not in tree
+            assert [k for k, _ in tree.range(1000, 1010)] == [1000, 1002, 1004, 1006, 1008]
+            tree.put(3, 3)
+            assert tree[3] == 3
+            for bad in ((2 ** 63, 5), (5, -2 ** 63 - 1), (1.5, 1)):
+                try:
+                    tree.put(*bad)
+                    assert False, "out-of-range put should fail"
+                except ValueError:
+                    pass
+            tree.commit()  # Still able to persist after rejected puts
+            try:
+                tree.bulk_load([(1, 1)])
+                assert False, "bulk_load into a non-empty tree should fail"
+            except ValueError:
+                pass
+
+        # Partly filled pages; over-full pages would overwrite their neighbours
+        fill_path = os.path.join(d, "fill.bpt")
+        with BPlusTree(fill_path, sync=False) as tree:
+            for fill in (0, -0.5, 1.5, float("nan")):
+                try:
+                    tree.bulk_load([(1, 1)], fill=fill)
+                    assert False, "fill outside (0, 1] should fail"
+                except ValueError:
+                    pass
+            tree.bulk_load(((k, k) for k in range(5000)), fill=0.5)
+        with BPlusTree(fill_path, sync=False) as tree:
+            assert list(tree.items()) == [(k, k) for k in range(5000)]
+
+        # A failed bulk_load leaves the tree empty, also after reopening
+        failed_path = os.path.join(d, "failed.bpt")
+        for bad in ([(1, 1), (0, 0)], [(1, 1), (2 ** 63, 0)]):
+            with BPlusTree(failed_path, sync=False) as tree:
+                try:
+                    tree.bulk_load(bad)
+                    assert False, "invalid bulk_load input should fail"
+                except ValueError:
+                    pass
+                assert len(tree) == 0 and list(tree.items()) == []
+            with BPlusTree(failed_path, sync=False) as tree:
+                assert len(tree) == 0 and list(tree.items()) == []
+
+    print("✅ All B+ tree tests passed!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    test_bplus_tree()
+
+    # Benchmark: python bplus_tree.py [n]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,321 @@
+"""
+Heap and Priority Queue Implementations
+=======================================
+
+Array-backed min-heaps and an indexed priority queue:
+
+    - DaryHeap:   implicit d-ary tree in a Python list; children of slot i
+                  are d*i+1 .. d*i+d. Wider nodes mean a shallower tree
+                  (fewer moves on push) at the cost of more comparisons
+                  per level on pop.
+    - BinaryHeap: the d = 2 case.
+    - IndexedPriorityQueue: heap of items with a position map, so the
+                  priority of an item already in the queue can be changed
+                  in O(log n) - which heapq cannot do. This is what
+                  Dijkstra / Prim style algorithms need.
+
+Operations and Time Complexity (d-ary heap):
+    - Heapify:            O(n)
+    - Push:               O(log_d n)
+    - Pop:                O(d log_d n)
+    - Pushpop / replace:  O(d log_d n)
+    - Peek:               O(1)
+
+Space Complexity: O(n)
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class DaryHeap:
+    """Array-backed d-ary min-heap."""
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, d: int = 4):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self._heap: List[Any] = list(iterable) if iterable is not None else []
+        self._heapify()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._heap})"
+
+    def _heapify(self) -> None:
+        """Bottom-up heap construction. O(n)"""
+        n = len(self._heap)
+        for i in range((n - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def _sift_up(self, i: int) -> None:
+        heap, d = self._heap, self.d
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not item < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            i = parent
+        heap[i] = item
+
+    def _sift_down(self, i: int) -> None:
+        heap, d = self._heap, self.d
+        n = len(heap)
+        item = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Smallest child among up to d siblings
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if heap[child] < heap[best]:
+                    best = child
+            if not heap[best] < item:
+                break
+            heap[i] = heap[best]
+            i = best
+        heap[i] = item
+
+    def push(self, item: Any) -> None:
+        """Add an item. O(log_d n)"""
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> Any:
+        """Return the smallest item without removing it."""
+        if not self._heap:
+            raise IndexError("peek from empty heap")
+        return self._heap[0]
+
+    def pop(self) -> Any:
+        """Remove and return the smallest item."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from empty heap")
+        last = heap.pop()
+        if not heap:
+            return last
+        smallest = heap[0]
+        heap[0] = last
+        self._sift_down(0)
+        return smallest
+
+    def pushpop(self, item: Any) -> Any:
+        """Push item, then pop and return the smallest (faster than both)."""
+        heap = self._heap
+        if heap and heap[0] < item:
+            item, heap[0] = heap[0], item
+            self._sift_down(0)
+        return item
+
+    def replace(self, item: Any) -> Any:
+        """Pop and return the smallest, then push item (heap must be non-empty)."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("replace on empty heap")
+        smallest = heap[0]
+        heap[0] = item
+        self._sift_down(0)
+        return smallest
+
+
+class BinaryHeap(DaryHeap):
+    """Array-backed binary min-heap."""
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None):
+        super().__init__(iterable, d=2)
+
+
+class IndexedPriorityQueue:
+    """
+    Min-priority queue over hashable items with O(log n) priority updates.
+
+    Each item appears at most once; the item itself is its handle.
+    Items with equal priority come out in insertion order.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, int, Hashable]] = []  # (priority, seq, item)
+        self._pos: Dict[Hashable, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def _swap_in(self, i: int, entry) -> None:
+        self._heap[i] = entry
+        self._pos[entry[2]] = i
+
+    def _sift_up(self, i: int) -> None:
+        heap = self._heap
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not entry < heap[parent]:
+                break
+            self._swap_in(i, heap[parent])
+            i = parent
+        self._swap_in(i, entry)
+
+    def _sift_down(self, i: int) -> None:
+        heap = self._heap
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            self._swap_in(i, heap[child])
+            i = child
+        self._swap_in(i, entry)
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        """Add item with priority; ValueError if it is already queued."""
+        if item in self._pos:
+            raise ValueError(f"{item!r} is already in the queue")
+        self._heap.append((priority, self._seq, item))
+        self._seq += 1
+        self._sift_up(len(self._heap) - 1)
+
+    def priority(self, item: Hashable) -> Any:
+        """Current priority of item; KeyError if absent."""
+        return self._heap[self._pos[item]][0]
+
+    def update(self, item: Hashable, priority: Any) -> None:
+        """Set the priority of a queued item (up or down), or push it. O(log n)"""
+        i = self._pos.get(item)
+        if i is None:
+            self.push(item, priority)
+            return
+        old = self._heap[i]
+        self._heap[i] = (priority, old[1], item)
+        if priority < old[0]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def decrease_key(self, item: Hashable, priority: Any) -> None:
+        """Lower the priority of a queued item; ValueError if it would rise."""
+        if self.priority(item) < priority:
+            raise ValueError("new priority is greater than the current one")
+        self.update(item, priority)
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """Return (item, priority) with the smallest priority."""
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        priority, _, item = self._heap[0]
+        return item, priority
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove and return (item, priority) with the smallest priority."""
+        if not self._heap:
+            raise IndexError("pop from empty priority queue")
+        item, priority = self.peek()
+        self._remove_at(0)
+        return item, priority
+
+    def remove(self, item: Hashable) -> Any:
+        """Remove a queued item and return its priority; KeyError if absent."""
+        i = self._pos[item]
+        priority = self._heap[i][0]
+        self._remove_at(i)
+        return priority
+
+    def _remove_at(self, i: int) -> None:
+        heap = self._heap
+        del self._pos[heap[i][2]]
+        last = heap.pop()
+        if i < len(heap):
+            self._swap_in(i, last)
+            self._sift_down(i)
+            self._sift_up(self._pos[last[2]])
+
+
+def test_heap():
+    """Test cases for heaps and the indexed priority queue."""
+    import random
+
+    rng = random.Random(18)
+    data = [rng.randrange(1000) for _ in range(500)]
+
+    for heap in (BinaryHeap(data), DaryHeap(data, d=3), DaryHeap(data, d=8)):
+        assert len(heap) == 500 and heap.peek() == min(data)
+        assert [heap.pop() for _ in range(500)] == sorted(data)
+        try:
+            heap.pop()
+            assert False, "pop from empty heap should raise"
+        except IndexError:
+            pass
+
+    heap = BinaryHeap()
+    for x in [5, 3, 8, 1]:
+        heap.push(x)
+    assert heap.pushpop(0) == 0        # Smaller than everything: returned as is
+    assert heap.pushpop(4) == 1
+    assert heap.replace(10) == 3       # Always pops first
+    assert [heap.pop() for _ in range(len(heap))] == [4, 5, 8, 10]
+    assert BinaryHeap().pushpop(7) == 7
+
+    # Top-k with a bounded heap
+    top = DaryHeap(data[:10])
+    for x in data[10:]:
+        if x > top.peek():
+            top.replace(x)
+    assert sorted(top.pop() for _ in range(10)) == sorted(data)[-10:]
+
+    # Indexed priority queue
+    pq = IndexedPriorityQueue()
+    for name, prio in [("a", 5), ("b", 3), ("c", 9), ("d", 3)]:
+        pq.push(name, prio)
+    assert len(pq) == 4 and "c" in pq
+    pq.decrease_key("c", 1)
+    assert pq.peek() == ("c", 1)
+    pq.update("b", 7)
+    assert pq.priority("b") == 7
+    try:
+        pq.decrease_key("a", 6)
+        assert False, "raising a priority via decrease_key should fail"
+    except ValueError:
+        pass
+    assert pq.remove("a") == 5 and "a" not in pq
+    assert [pq.pop() for _ in range(3)] == [("c", 1), ("d", 3), ("b", 7)]
+
+    # Randomised comparison against a dict of priorities
+    pq, ref = IndexedPriorityQueue(), {}
+    for _ in range(3000):
+        item = rng.randrange(200)
+        op = rng.random()
+        if op < 0.5:
+            prio = rng.randrange(1000)
+            pq.update(item, prio)
+            ref[item] = prio
+        elif op < 0.7 and item in ref:
+            assert pq.remove(item) == ref.pop(item)
+        elif ref:
+            item, prio = pq.pop()
+            assert prio == min(ref.values()) and ref.pop(item) == prio
+    assert len(pq) == len(ref)
+
+    print("✅ All heap tests passed!")
+
+
+if __name__ == "__main__":
+    test_heap()
+
+    # Example usage
+    pq = IndexedPriorityQueue()
+    for task, prio in [("write", 3), ("test", 2), ("deploy", 5)]:
+        pq.push(task, prio)
+    pq.decrease_key("deploy", 1)
+    print(f"Order: {[pq.pop() for _ in range(len(pq))]}")
@@ -0,0 +1,402 @@
+"""
+Compact Binary Tree Storage
+===========================
+
+Persists binary trees (any node with ``val`` / ``left`` / ``right``, such
+as ``TreeNode`` from algorithms/2025-12/binary_tree_143002.py) in a flat,
+fixed-width binary format instead of pickling object graphs:
+
+    header  16 bytes: magic b"BTRE", version, value typecode,
+                      index typecode, padding, node count (u64)
+    values  n x 8 bytes   (int64 'q' or float64 'd'), in preorder
+    left    n x 4/8 bytes (child index, -1 if none)
+    right   n x 4/8 bytes
+
+All columns are little-endian. Node 0 is the root, and the left child of
+node i (if any) is always node i + 1.
+
+``MappedTree`` serves traversals and lookups straight from an ``mmap``
+of that file without creating node objects, so opening a tree of any
+size is O(1) and pages are read from disk only when touched.
+
+Operations and Time Complexity:
+    - save_tree / load_tree:       O(n)
+    - MappedTree open:             O(1)
+    - Traversals:                  O(n), preorder is a sequential scan
+    - find (BST ordered trees):    O(height)
+
+Space Complexity: 16 + (8 + 2 * index width) bytes per node on disk,
+O(height) extra memory for traversals
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Any, Callable, Iterator, Optional
+
+MAGIC = b"BTRE"
+VERSION = 1
+HEADER = struct.Struct("<4sBccxQ")
+NONE = -1
+
+
+def _check_byteorder() -> None:
+    if sys.byteorder != "little":
+        raise RuntimeError("tree storage files are little-endian; big-endian hosts are unsupported")
+
+
+def save_tree(root: Any, path: str) -> int:
+    """
+    Write a binary tree to path in the flat binary format.
+
+    Args:
+        root: Root node (objects with val / left / right), or None
+        path: Output file
+
+    Returns:
+        Number of nodes written
+    """
+    _check_byteorder()
+    values: list = []
+    left = array("q")
+    right = array("q")
+
+    # Iterative preorder; each stack entry knows which parent slot to patch
+    stack = [(root, NONE, False)] if root is not None else []
+    while stack:
+        node, parent, is_right = stack.pop()
+        index = len(values)
+        values.append(node.val)
+        left.append(NONE)
+        right.append(NONE)
+        if parent != NONE:
+            (right if is_right else left)[parent] = index
+        if node.right is not None:
+            stack.append((node.right, index, True))
+        if node.left is not None:
+            stack.append((node.left, index, False))
+
+    if all(type(v) is int for v in values):
+        value_code = "q"
+    elif all(isinstance(v, (int, float)) for v in values):
+        value_code = "d"
+    else:
+        raise TypeError("tree values must be ints or floats")
+    n = len(values)
+    index_code = "i" if n < 2 ** 31 else "q"
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, value_code.encode(), index_code.encode(), n))
+        array(value_code, values).tofile(f)
+        array(index_code, left).tofile(f)
+        array(index_code, right).tofile(f)
+    return n
+
+
+class MappedTree:
+    """Read-only binary tree served from a memory-mapped file."""
+
+    def __init__(self, path: str):
+        _check_byteorder()
+        self._file = open(path, "rb")
+        self._mmap = None
+        self._buffers = []
+        try:
+            self._open(path)
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self, path: str) -> None:
+        header = self._file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a tree storage file")
+        magic, version, value_code, index_code, n = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tree storage file")
+        value_code, index_code = value_code.decode("latin-1"), index_code.decode("latin-1")
+        if value_code not in ("q", "d") or index_code not in ("i", "q"):
+            raise ValueError(f"{path} has unsupported column types {value_code!r}/{index_code!r}")
+        index_size = array(index_code).itemsize
+        expected = HEADER.size + (8 + 2 * index_size) * n
+        actual = os.fstat(self._file.fileno()).st_size
+        if actual != expected:
+            raise ValueError(f"{path} holds {actual} bytes, expected {expected} for {n} nodes")
+
+        self._n = n
+        if n == 0:
+            self.values = self.left = self.right = ()
+            return
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        offsets = (HEADER.size, HEADER.size + 8 * n, HEADER.size + (8 + index_size) * n)
+        base = memoryview(self._mmap)
+        self._buffers.append(base)
+        self.values = self._column(base, offsets[0], 8 * n, value_code)
+        self.left = self._column(base, offsets[1], index_size * n, index_code)
+        self.right = self._column(base, offsets[2], index_size * n, index_code)
+
+    def _column(self, base: memoryview, offset: int, size: int, code: str) -> memoryview:
+        raw = base[offset:offset + size]
+        view = raw.cast(code)
+        self._buffers.extend((raw, view))
+        return view
+
+    def close(self) -> None:
+        """
+        Release the mapping; the object is unusable afterwards.
+
+        ``values`` / ``left`` / ``right`` are views into the mapping. Slices
+        or buffers a caller still holds from them keep the pages mapped
+        (and valid) until they are dropped; close() still closes the file
+        and never raises for them.
+        """
+        for buffer in reversed(self._buffers):
+            try:
+                buffer.release()
+            except BufferError:
+                pass    # Exported by the caller; freed with the last export
+        self._buffers.clear()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass    # Unmapped when the caller's views are collected
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def root(self) -> Optional[int]:
+        """Index of the root node, None for an empty tree."""
+        return 0 if self._n else None
+
+    def iter_preorder(self) -> Iterator[Any]:
+        """Preorder is the storage order: a straight sequential scan."""
+        return iter(self.values)
+
+    def iter_inorder(self) -> Iterator[Any]:
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        i = 0 if self._n else NONE
+        while stack or i != NONE:
+            while i != NONE:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield values[i]
+            i = right[i]
+
+    def iter_postorder(self) -> Iterator[Any]:
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        i, last = (0 if self._n else NONE), NONE
+        while stack or i != NONE:
+            while i != NONE:
+                stack.append(i)
+                i = left[i]
+            top = stack[-1]
+            if right[top] != NONE and right[top] != last:
+                i = right[top]
+            else:
+                yield values[top]
+                last = stack.pop()
+
+    def iter_level_order(self) -> Iterator[Any]:
+        values, left, right = self.values, self.left, self.right
+        queue = deque([0] if self._n else [])
+        while queue:
+            i = queue.popleft()
+            yield values[i]
+            if left[i] != NONE:
+                queue.append(left[i])
+            if right[i] != NONE:
+                queue.append(right[i])
+
+    def find(self, value: Any) -> int:
+        """
+        Find value in a binary *search* tree.
+
+        Returns:
+            Node index holding value, -1 if not found
+        """
+        values, left, right = self.values, self.left, self.right
+        i = 0 if self._n else NONE
+        while i != NONE:
+            current = values[i]
+            if value < current:
+                i = left[i]
+            elif current < value:
+                i = right[i]
+            else:
+                return i
+        return NONE
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) != NONE
+
+    def to_tree(self, node_factory: Callable[[Any], Any]) -> Any:
+        """Materialize the whole tree as node objects (e.g. TreeNode)."""
+        if not self._n:
+            return None
+        nodes = [node_factory(v) for v in self.values]
+        left, right = self.left, self.right
+        for i, node in enumerate(nodes):
+            if left[i] != NONE:
+                node.left = nodes[left[i]]
+            if right[i] != NONE:
+                node.right = nodes[right[i]]
+        return nodes[0]
+
+
+def load_tree(path: str, node_factory: Callable[[Any], Any]) -> Any:
+    """Read a stored tree back into node objects built by node_factory."""
+    with MappedTree(path) as tree:
+        return tree.to_tree(node_factory)
+
+
+def test_tree_storage():
+    """Test cases for tree storage."""
+    import random
+    import tempfile
+
+    class Node:
+        def __init__(self, val):
+            self.val = val
+            self.left = None
+            self.right = None
+
+    def bst_insert(root, val):
+        if root is None:
+            return Node(val)
+        node = root
+        while True:
+            side = "left" if val < node.val else "right"
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, Node(val))
+                return root
+            node = child
+
+    def inorder(node):
+        return inorder(node.left) + [node.val] + inorder(node.right) if node else []
+
+    def preorder(node):
+        return [node.val] + preorder(node.left) + preorder(node.right) if node else []
+
+    rng = random.Random(19)
+    keys = rng.sample(range(-10**12, 10**12), 500)
+    root = None
+    for key in keys:
+        root = bst_insert(root, key)
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "tree.bin")
+        assert save_tree(root, path) == 500
+        assert os.path.getsize(path) == 16 + 500 * (8 + 4 + 4)
+
+        with MappedTree(path) as tree:
+            assert len(tree) == 500 and tree.root == 0
+            assert list(tree.iter_inorder()) == sorted(keys)
+            assert list(tree.iter_preorder()) == preorder(root)
+            assert list(tree.iter_level_order())[0] == keys[0]
+            assert list(tree.iter_postorder())[-1] == keys[0]
+            assert tree.values[tree.find(keys[123])] == keys[123]
+            assert tree.find(10**13) == -1 and keys[0] in tree
+
+        copy = load_tree(path, Node)
+        assert inorder(copy) == sorted(keys) and preorder(copy) == preorder(root)
+
+        # Floats, a deep chain and an empty tree
+        chain = Node(0.5)
+        node = chain
+        for i in range(1, 5000):
+            node.right = Node(i + 0.5)
+            node = node.right
+        save_tree(chain, path)
+        with MappedTree(path) as tree:
+            assert list(tree.iter_inorder()) == [i + 0.5 for i in range(5000)]
+            assert tree.find(4999.5) == 4999
+
+        # A slice the caller still holds must not break close(); the file
+        # is closed and the slice stays readable until it is dropped
+        with MappedTree(path) as tree:
+            head = tree.values[:2]
+            handle = tree._file
+        assert handle.closed and list(head) == [0.5, 1.5]
+        try:
+            tree.values[0]
+            assert False, "closed tree should not be readable"
+        except ValueError:
+            pass
+        del head
+
+        save_tree(None, path)
+        with MappedTree(path) as tree:
+            assert len(tree) == 0 and tree.root is None
+            assert list(tree.iter_inorder()) == [] and tree.find(1) == -1
+        assert load_tree(path, Node) is None
+
+        # Corrupt files: bad magic, truncated columns, trailing bytes,
+        # unknown typecodes - all rejected up front with ValueError
+        save_tree(root, path)
+        with open(path, "rb") as f:
+            good = f.read()
+        bad_codes = HEADER.pack(MAGIC, VERSION, b"f", b"i", 500) + good[HEADER.size:]
+        for data in (b"not a tree", good[:-3], good[:-4], good + b"\0", bad_codes):
+            with open(path, "wb") as f:
+                f.write(data)
+            try:
+                MappedTree(path)
+                assert False, "bad file should be rejected"
+            except ValueError:
+                pass
+
+    print("✅ All tree storage tests passed!")
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    test_tree_storage()
+
+    # Example: a perfectly balanced BST of n nodes, stored then re-opened
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    class Node:
+        __slots__ = ("val", "left", "right")
+
+        def __init__(self, val):
+            self.val, self.left, self.right = val, None, None
+
+    def build(lo, hi):
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = Node(mid)
+        node.left, node.right = build(lo, mid - 1), build(mid + 1, hi)
+        return node
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "tree.bin")
+        save_tree(build(0, n - 1), path)
+        start = time.perf_counter()
+        with MappedTree(path) as tree:
+            opened = time.perf_counter() - start
+            start = time.perf_counter()
+            found = tree.find(n // 3)
+            lookup = time.perf_counter() - start
+            print(f"{n:,} nodes ({os.path.getsize(path) / 1e6:.1f} MB): "
+                  f"open {opened * 1e3:.2f} ms, find {lookup * 1e6:.1f} us -> node {found}")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Sorting & Searching Benchmark Suite
+===================================
+
+Runs every sort/search implementation in algorithms/ over standard input
+shapes and sizes, records ops/sec and peak memory to JSON, and compares
+the run against a stored baseline. Exits with status 1 when any case got
+slower (or hungrier) than the configured threshold, so it can gate
+upgrades.
+
+Input shapes: random, sorted, reversed, few_unique, organ_pipe
+Sizes:        any of 1e2 .. 1e7 (quadratic sorts are capped)
+
+Usage:
+    python benchmark.py --output results.json
+    python benchmark.py --sizes 100 1000 100000 --only sort
+    python benchmark.py --baseline baseline.json --threshold 0.10
+    python benchmark.py --output baseline.json   # refresh the baseline
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+
+SHAPES = ("random", "sorted", "reversed", "few_unique", "organ_pipe")
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+SEARCH_QUERIES = 1_000
+
+
+def load_module(relative_path: str):
+    """Import a module by path; its directory goes on sys.path for sibling imports."""
+    path = PROJECT_ROOT / relative_path
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_input(shape: str, n: int, seed: int = 42) -> list:
+    """Generate one of the standard input shapes."""
+    rng = random.Random(seed)
+    if shape == "random":
+        return [rng.randrange(n * 4) for _ in range(n)]
+    if shape == "sorted":
+        return list(range(n))
+    if shape == "reversed":
+        return list(range(n, 0, -1))
+    if shape == "few_unique":
+        return [rng.randrange(8) for _ in range(n)]
+    if shape == "organ_pipe":
+        half = n // 2
+        return list(range(half)) + list(range(n - half, 0, -1))
+    raise ValueError(f"Unknown shape {shape!r}")
+
+
+def build_cases() -> list:
+    """
+    Return (name, kind, max_size, setup) tuples.
+
+    setup(data) returns (callable, ops) where ops is how many operations
+    one call of the callable performs.
+    """
+    bubble = load_module("algorithms/sorting/bubble_sort.py")
+    hybrid = load_module("algorithms/sorting/hybrid_sort.py")
+    integer = load_module("algorithms/sorting/integer_sort.py")
+    quick = load_module("algorithms/2025-12/quick_sort_163001.py")
+    search = load_module("algorithms/searching/binary_search.py")
+    static = load_module("algorithms/searching/static_search_index.py")
+    adaptive = load_module("algorithms/searching/adaptive_search.py")
+
+    def sorter(fn, convert=None):
+        def setup(data):
+            if convert is not None:
+                data = convert(data)
+            return (lambda: fn(data)), 1
+        return setup
+
+    def search_input(data):
+        arr = sorted(data)
+        rng = random.Random(7)
+        top = arr[-1] + 2 if arr else 1
+        return arr, [rng.randrange(-1, top) for _ in range(SEARCH_QUERIES)]
+
+    def searcher(make_lookup):
+        def setup(data):
+            arr, queries = search_input(data)
+            lookup = make_lookup(arr)
+            return (lambda: [lookup(q) for q in queries]), len(queries)
+        return setup
+
+    def batch_setup(data):
+        arr, queries = search_input(data)
+        return (lambda: search.search_many(arr, queries)), len(queries)
+
+    def smart_lookup(arr):
+        method = adaptive.choose_search_method(arr)
+        return lambda q: adaptive.smart_search(arr, q, method)
+
+    return [
+        ("bubble_sort", "sort", 1_000, sorter(bubble.bubble_sort)),
+        ("hybrid_sort", "sort", None, sorter(hybrid.hybrid_sort)),
+        ("quick_sort", "sort", None, sorter(quick.quick_sort)),
+        ("radix_sort", "sort", None, sorter(integer.radix_sort, lambda d: array("q", d))),
+        ("builtin_sorted", "sort", None, sorter(sorted)),
+        ("binary_search_iterative", "search", None,
+         searcher(lambda arr: lambda q: search.binary_search_iterative(arr, q))),
+        ("lower_bound", "search", None,
+         searcher(lambda arr: lambda q: search.lower_bound(arr, q))),
+        ("search_many", "search", None, batch_setup),
+        ("static_search_index", "search", None,
+         searcher(lambda arr: static.StaticSearchIndex(arr).find)),
+        ("smart_search", "search", None, searcher(smart_lookup)),
+    ]
+
+
+def measure(fn, ops: int, min_time: float) -> dict:
+    """Best-of-rounds throughput plus peak traced memory of one call."""
+    best = float("inf")
+    elapsed_total = 0.0
+    rounds = 0
+    while rounds < 3 or (elapsed_total < min_time and rounds < 1000):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        elapsed_total += elapsed
+        rounds += 1
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": ops / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+        "rounds": rounds,
+    }
+
+
+def run_benchmarks(sizes, shapes, only=None, min_time: float = 0.2) -> dict:
+    """Run every case and return the results document."""
+    results = {}
+    for name, kind, max_size, setup in build_cases():
+        label = f"{kind}/{name}"
+        if only and not any(part in label for part in only):
+            continue
+        for n in sizes:
+            if max_size is not None and n > max_size:
+                continue
+            for shape in shapes:
+                fn, ops = setup(make_input(shape, n))
+                key = f"{label}/{shape}/{n}"
+                results[key] = measure(fn, ops, min_time)
+                print(f"  {key:<55} {results[key]['ops_per_sec']:>14,.1f} ops/s "
+                      f"{results[key]['peak_bytes'] / 1024:>10,.1f} KiB")
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def selected(key: str, sizes, shapes, only=None) -> bool:
+    """Whether a result key ('kind/name/shape/n') falls inside this run's filters."""
+    label, shape, n = key.rsplit("/", 2)
+    return (int(n) in sizes and shape in shapes
+            and (not only or any(part in label for part in only)))
+
+
+def compare(current: dict, baseline: dict, threshold: float,
+            memory_threshold: float, expected=None) -> list:
+    """
+    Compare two results documents.
+
+    Args:
+        expected: Predicate on baseline keys that this run should have
+            produced (e.g. via selected()); None expects all of them.
+            Expected keys that are missing - a crashed or renamed
+            benchmark - count as regressions.
+
+    Returns:
+        List of human-readable regression messages (empty if none)
+    """
+    regressions = []
+    for key, base in baseline["results"].items():
+        now = current["results"].get(key)
+        if now is None:
+            if expected is None or expected(key):
+                regressions.append(f"{key}: missing from the current run")
+            continue
+        slowdown = base["ops_per_sec"] / now["ops_per_sec"] - 1
+        if slowdown > threshold:
+            regressions.append(f"{key}: {slowdown:.1%} slower "
+                               f"({base['ops_per_sec']:,.1f} -> {now['ops_per_sec']:,.1f} ops/s)")
+        if base["peak_bytes"] and \
+                now["peak_bytes"] / base["peak_bytes"] - 1 > memory_threshold:
+            regressions.append(f"{key}: peak memory {base['peak_bytes']:,} -> "
+                               f"{now['peak_bytes']:,} bytes")
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark sorting and searching implementations",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark.py --output results.json
+  python benchmark.py --sizes 100 10000 --shapes random sorted --only sort
+  python benchmark.py --baseline baseline.json --threshold 0.10
+        """
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Input sizes (default: 1e2 1e3 1e4 1e5)")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES),
+                        help="Input shapes (default: all)")
+    parser.add_argument("--only", nargs="+",
+                        help="Only run cases whose 'kind/name' contains one of these")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Minimum seconds spent timing each case (default: 0.2)")
+    parser.add_argument("--output", "-o", help="Write results JSON to this file")
+    parser.add_argument("--baseline", "-b", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed throughput regression, as a fraction (default: 0.10)")
+    parser.add_argument("--memory-threshold", type=float, default=0.25,
+                        help="Allowed peak memory growth, as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    print(f"🏁 Benchmarking sizes={args.sizes} shapes={args.shapes}")
+    current = run_benchmarks(args.sizes, args.shapes, args.only, args.min_time)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2, sort_keys=True))
+        print(f"✅ Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(current, baseline, args.threshold, args.memory_threshold,
+                              lambda key: selected(key, args.sizes, args.shapes, args.only))
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for message in regressions:
+                print(f"   {message}")
+            return 1
+        print(f"✅ No regressions against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())